@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast-json" extra
+    orjson = None
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode JSON text or UTF-8 bytes, using orjson when it is installed.
+
+    Decode failures raise json.JSONDecodeError (orjson's error subclasses it).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, *, indent: int | None = None) -> bytes:
+    """Encode *obj* as UTF-8 JSON bytes without escaping non-ASCII text.
+
+    orjson is used for the common indent=2 case, where its output matches
+    json.dumps byte for byte apart from float exponent spelling (1e-7 vs
+    1e-07); other indents go through the stdlib encoder.
+    """
+    if orjson is not None and indent == 2:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=indent, ensure_ascii=False).encode("utf-8")
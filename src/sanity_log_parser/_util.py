@@ -1,35 +1,33 @@
 from __future__ import annotations
 
+# The as_* helpers coerce JSON-decoded values, whose types are exactly
+# int/bool/str/list, so exact type checks replace isinstance().
+
 
 def as_int(value: object, default: int) -> int:
-    if isinstance(value, bool):
-        return int(value)
-    if isinstance(value, int):
+    if type(value) is int:
         return value
+    if type(value) is bool:
+        return int(value)
     return default
 
 
 def as_str(value: object, default: str) -> str:
-    return value if isinstance(value, str) and value else default
+    return value if type(value) is str and value else default
 
 
 def as_optional_str(value: object) -> str | None:
-    if isinstance(value, str) and value:
+    if type(value) is str and value:
         return value
     return None
 
 
 def as_str_list(value: object) -> list[str]:
-    if not isinstance(value, list):
+    if type(value) is not list:
         return []
-    return [item for item in value if isinstance(item, str)]
-
-
-def first_non_empty(*values: str | None) -> str:
-    for value in values:
-        if value:
-            return value
-    return ""
+    # Bound locally so the comprehension avoids a builtins lookup per item.
+    str_type = str
+    return [item for item in value if type(item) is str_type]
 
 
 def trim_to_none(value: str | None) -> str | None:
@@ -8,6 +8,7 @@ import logging
 import os
 import sys
 import time
+from collections.abc import Sequence
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast, Literal
 
@@ -17,7 +18,7 @@ from .config.resolution import (
 )
 from .console import Console
 from .clustering.logic import LogicClusterer
-from .parsing import parse_log_file
+from .parsing import ParsedRow, parse_log_file
 from .results.schema_v2 import (
     Group,
     RunMetadata,
@@ -48,6 +49,17 @@ class PipelineOptions:
     log_file: str
     template_file: str | None = None
     sanity_item: str | None = None
+    jobs: int = 1
+
+
+def _positive_int(text: str) -> int:
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {text!r}") from None
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
 
 
 def _add_common_options(parser: argparse.ArgumentParser) -> None:
@@ -83,6 +95,13 @@ def _add_common_options(parser: argparse.ArgumentParser) -> None:
         default=0,
         help="Maximum original logs per group (0 = all).",
     )
+    _ = parser.add_argument(
+        "-j",
+        "--jobs",
+        type=_positive_int,
+        default=1,
+        help="Worker processes for parsing a single-file PrimeTime report.",
+    )
     _ = parser.add_argument(
         "--no-color", action="store_true", help="Disable ANSI color output."
     )
@@ -329,14 +348,14 @@ def _validate_input_files(log_file: str, template_file: str | None) -> str | Non
 
 
 def _validate_and_parse(
-    log_file: str, template_file: str | None
-) -> list[dict[str, Any]]:
+    log_file: str, template_file: str | None, workers: int = 1
+) -> list[ParsedRow]:
     """Validate input files and parse logs. Raises ParseError on failure."""
     error = _validate_input_files(log_file, template_file)
     if error:
         raise ParseError(error)
     try:
-        return cast(list[dict[str, Any]], parse_log_file(log_file, template_file))
+        return parse_log_file(log_file, template_file, workers=workers)
     except Exception as exc:
         raise ParseError(f"Failed to parse '{log_file}': {exc}") from exc
 
@@ -431,7 +450,7 @@ def _build_final_groups(
     return final_groups
 
 
-def _run_pipeline(parsed_logs: list[dict[str, Any]], opts: PipelineOptions) -> int:
+def _run_pipeline(parsed_logs: list[ParsedRow], opts: PipelineOptions) -> int:
     """Run the clustering pipeline: config → logic cluster → AI cluster → write."""
     pipeline_t0 = time.perf_counter()
     console = Console(use_color=False if opts.no_color else None)
@@ -552,10 +571,13 @@ def _run_cluster(args: argparse.Namespace) -> int:
         verbose=cast(bool, args.verbose),
         log_file=cast(str, args.log_file),
         template_file=cast(str | None, args.template_file),
+        jobs=cast(int, args.jobs),
     )
     try:
         t0 = time.perf_counter()
-        parsed_logs = _validate_and_parse(opts.log_file, opts.template_file)
+        parsed_logs = _validate_and_parse(
+            opts.log_file, opts.template_file, opts.jobs
+        )
         logger.info("[timing] parsing: %.3fs", time.perf_counter() - t0)
     except ParseError as exc:
         print(str(exc), file=sys.stderr)
@@ -577,10 +599,13 @@ def _run_gca(args: argparse.Namespace) -> int:
         log_file=cast(str, args.log_file),
         template_file=None,
         sanity_item="gca",
+        jobs=cast(int, args.jobs),
     )
     try:
         t0 = time.perf_counter()
-        parsed_logs = _validate_and_parse(opts.log_file, opts.template_file)
+        parsed_logs = _validate_and_parse(
+            opts.log_file, opts.template_file, opts.jobs
+        )
         logger.info("[timing] parsing: %.3fs", time.perf_counter() - t0)
     except ParseError as exc:
         print(str(exc), file=sys.stderr)
@@ -908,9 +933,13 @@ def _run_view(args: argparse.Namespace) -> int:
     return print_report(results_json, top=top, no_color=no_color)
 
 
-def main() -> int:
-    parser = _build_parser()
-    args = parser.parse_args()
+def main(
+    argv: Sequence[str] | None = None,
+    parser: argparse.ArgumentParser | None = None,
+) -> int:
+    if parser is None:
+        parser = _build_parser()
+    args = parser.parse_args(argv)
 
     command = cast(str, args.command)
     if command == "gca":
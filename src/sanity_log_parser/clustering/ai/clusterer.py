@@ -81,6 +81,7 @@ class AIClusterer:
                     base_url=openai_settings.base_url,
                     model=openai_settings.model,
                     api_key=openai_settings.api_key,
+                    batch_size=embed_batch_size,
                 )
                 self.ai_available = True
         elif self.dbscan_factory is not None:
@@ -2,22 +2,37 @@ from __future__ import annotations
 
 import re
 from collections import defaultdict
+from collections.abc import Sequence
 from typing import Any
 
+from sanity_log_parser.parsing.row import ParsedRow
+
+_DIGITS_RE = re.compile(r"\d+")
+
 
 class LogicClusterer:
     def get_logic_signature(self, var_tuple: tuple[str, ...]) -> str:
         if not var_tuple or var_tuple == ("NO_VAR",):
             return "NO_VAR"
-        signatures = [re.sub(r"\d+", "*", str(v)) for v in var_tuple]
+        signatures = [_DIGITS_RE.sub("*", str(v)) for v in var_tuple]
         return " / ".join(signatures)
 
-    def run(self, parsed_logs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    def run(
+        self, parsed_logs: Sequence[ParsedRow | dict[str, Any]]
+    ) -> list[dict[str, Any]]:
         groups = defaultdict(list)
         for parsed_log in parsed_logs:
-            full_sig = self.get_logic_signature(parsed_log["variables"])
-            key = (parsed_log["rule_id"], full_sig, parsed_log["template"])
-            groups[key].append(parsed_log)
+            # Attribute reads skip ParsedRow's Python-level __getitem__.
+            if isinstance(parsed_log, ParsedRow):
+                variables = parsed_log.variables
+                rule_id = parsed_log.rule_id
+                template = parsed_log.template
+            else:
+                variables = parsed_log["variables"]
+                rule_id = parsed_log["rule_id"]
+                template = parsed_log["template"]
+            full_sig = self.get_logic_signature(variables)
+            groups[(rule_id, full_sig, template)].append(parsed_log)
 
         results = []
         for (rule_id, full_sig, temp), members in groups.items():
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 import sys
+from collections.abc import Iterable
 from typing import TextIO
 
 
@@ -34,24 +35,51 @@ class Console:
     ) -> None:
         self.stream: TextIO = stream if stream is not None else sys.stdout
         self.use_color: bool = supports_color(use_color, self.stream)
+        # Padded/painted kv labels and status prefixes, built once per text.
+        self._kv_labels: dict[str, str] = {}
+        self._status_prefixes: dict[str, str] = {}
 
     def _paint(self, text: str, code: str | None = None) -> str:
         if not self.use_color or not code:
             return text
         return f"{code}{text}{Ansi.RESET}"
 
+    def format_section(self, title: str) -> str:
+        return self._paint(title, Ansi.BOLD)
+
+    def format_kv(self, key: str, value: object) -> str:
+        label = self._kv_labels.get(key)
+        if label is None:
+            label = self._paint(f"{key}:".ljust(self._KEY_WIDTH), Ansi.CYAN)
+            self._kv_labels[key] = label
+        return f"{label} {value}"
+
+    def format_info(self, message: str) -> str:
+        return self._format_status("INFO", message, Ansi.CYAN)
+
+    def format_warn(self, message: str) -> str:
+        return self._format_status("WARN", message, Ansi.YELLOW)
+
+    def _format_status(self, level: str, message: str, color: str) -> str:
+        prefix = self._status_prefixes.get(level)
+        if prefix is None:
+            prefix = self._status_prefixes[level] = self._paint(f"[{level}]", color)
+        return f"{prefix} {message}"
+
+    def write_block(self, lines: Iterable[str]) -> None:
+        """Write *lines* with a single call on the underlying stream."""
+        block = list(lines)
+        if block:
+            self.stream.write("\n".join(block) + "\n")
+
     def section(self, title: str) -> None:
-        print(self._paint(title, Ansi.BOLD), file=self.stream)
+        print(self.format_section(title), file=self.stream)
 
     def kv(self, key: str, value: object) -> None:
-        label = f"{key}:".ljust(self._KEY_WIDTH)
-        if self.use_color:
-            label = self._paint(label, Ansi.CYAN)
-        print(f"{label} {value}", file=self.stream)
+        print(self.format_kv(key, value), file=self.stream)
 
     def _status(self, level: str, message: str, color: str) -> None:
-        prefix = self._paint(f"[{level}]", color)
-        print(f"{prefix} {message}", file=self.stream)
+        print(self._format_status(level, message, color), file=self.stream)
 
     def info(self, message: str) -> None:
         self._status("INFO", message, Ansi.CYAN)
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import http.client
 import json
-from typing import Any
+from typing import Any, cast
 from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+from urllib.parse import urlsplit
+from urllib.request import Request, build_opener, getproxies, proxy_bypass
+
+from .. import _json
 
 
 class EmbeddingsRequestError(RuntimeError):
@@ -17,17 +21,104 @@ class OpenAICompatibleEmbeddingsClient:
         model: str,
         api_key: str | None = None,
         timeout_seconds: int = 30,
+        batch_size: int = 256,
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.model = model
         self.api_key = api_key
         self.timeout_seconds = timeout_seconds
+        self.batch_size = batch_size
+
+        parts = urlsplit(self.base_url)
+        self._scheme = parts.scheme
+        self._host = parts.hostname or ""
+        self._port = parts.port
+        self._path = f"{parts.path}/embeddings"
+        self._conn: http.client.HTTPConnection | None = None
+        # The persistent connection talks to the host directly; requests that
+        # must go through a proxy are left to urllib, which honours
+        # HTTP(S)_PROXY and NO_PROXY.
+        proxied = self._scheme in getproxies()
+        self._use_urllib = proxied and not proxy_bypass(self._host)
+        self._opener = build_opener()
 
     def embed(self, inputs: list[str]) -> list[list[float]]:
         if not inputs:
             return []
+        if len(inputs) <= self.batch_size:
+            return self._embed_request(inputs)
+
+        vectors: list[list[float]] = []
+        for start in range(0, len(inputs), self.batch_size):
+            vectors.extend(self._embed_request(inputs[start : start + self.batch_size]))
+        return vectors
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _connection(self) -> http.client.HTTPConnection:
+        if self._conn is None:
+            if self._scheme == "https":
+                conn_cls: type[http.client.HTTPConnection] = http.client.HTTPSConnection
+            elif self._scheme == "http":
+                conn_cls = http.client.HTTPConnection
+            else:
+                raise EmbeddingsRequestError(
+                    f"Unsupported embeddings endpoint URL: {self.base_url}"
+                )
+            self._conn = conn_cls(self._host, self._port, timeout=self.timeout_seconds)
+        return self._conn
+
+    def _post(self, body: bytes, headers: dict[str, str]) -> tuple[int, str, bytes]:
+        if self._use_urllib:
+            return self._urlopen(body, headers)
+        try:
+            result = self._send(body, headers)
+        except (http.client.HTTPException, OSError):
+            # The server may have dropped an idle keep-alive socket; reconnect once.
+            self.close()
+            try:
+                result = self._send(body, headers)
+            except (http.client.HTTPException, OSError):
+                self.close()
+                raise
+        if 300 <= result[0] < 400:
+            # Redirects are left to urllib's redirect handler.
+            return self._urlopen(body, headers)
+        return result
+
+    def _send(self, body: bytes, headers: dict[str, str]) -> tuple[int, str, bytes]:
+        conn = self._connection()
+        conn.request("POST", self._path, body=body, headers=headers)
+        response = conn.getresponse()
+        return response.status, response.reason, self._read_body(response)
+
+    def _urlopen(self, body: bytes, headers: dict[str, str]) -> tuple[int, str, bytes]:
+        request = Request(
+            f"{self.base_url}/embeddings", data=body, headers=headers, method="POST"
+        )
+        try:
+            with self._opener.open(request, timeout=self.timeout_seconds) as response:
+                return response.status, response.reason, self._read_body(response)
+        except HTTPError as exc:
+            try:
+                error_body = exc.read()
+            except OSError:
+                error_body = b""
+            return exc.code, str(exc.reason), error_body
+
+    def _read_body(self, response: Any) -> bytes:
+        try:
+            return cast(bytes, response.read())
+        except (http.client.HTTPException, OSError) as exc:
+            self.close()
+            raise EmbeddingsRequestError(
+                f"I/O error calling embeddings endpoint: {exc}"
+            ) from exc
 
-        endpoint = f"{self.base_url}/embeddings"
+    def _embed_request(self, inputs: list[str]) -> list[list[float]]:
         payload = {"model": self.model, "input": inputs}
         body = json.dumps(payload).encode("utf-8")
 
@@ -35,26 +126,29 @@ class OpenAICompatibleEmbeddingsClient:
         if self.api_key:
             headers["Authorization"] = f"Bearer {self.api_key}"
 
-        request = Request(endpoint, data=body, headers=headers, method="POST")
         try:
-            with urlopen(request, timeout=self.timeout_seconds) as response:
-                response_body = response.read().decode("utf-8")
-        except HTTPError as exc:
-            details = _read_http_error_body(exc)
-            raise EmbeddingsRequestError(
-                f"HTTP {exc.code} calling embeddings endpoint: {details}"
-            ) from exc
+            status, reason, raw_body = self._post(body, headers)
         except URLError as exc:
             raise EmbeddingsRequestError(
                 f"Network error calling embeddings endpoint: {exc.reason}"
             ) from exc
+        except http.client.HTTPException as exc:
+            raise EmbeddingsRequestError(
+                f"Network error calling embeddings endpoint: {exc!r}"
+            ) from exc
         except OSError as exc:
             raise EmbeddingsRequestError(
-                f"I/O error calling embeddings endpoint: {exc}"
+                f"Network error calling embeddings endpoint: {exc}"
             ) from exc
 
+        if status >= 300:
+            details = raw_body.decode("utf-8", errors="replace") or reason
+            raise EmbeddingsRequestError(
+                f"HTTP {status} calling embeddings endpoint: {details}"
+            )
+
         try:
-            parsed = json.loads(response_body)
+            parsed = _json.loads(raw_body)
         except json.JSONDecodeError as exc:
             raise EmbeddingsRequestError(
                 f"Embeddings response is not valid JSON: {exc}"
@@ -75,7 +169,12 @@ def _parse_openai_embeddings_response(
             "Embeddings response is missing a valid 'data' list."
         )
 
-    indexed_vectors: dict[int, list[float]] = {}
+    if len(raw_data) != expected_size:
+        raise EmbeddingsRequestError(
+            f"Embeddings response size mismatch: expected {expected_size}, received {len(raw_data)}."
+        )
+
+    vectors: list[list[float] | None] = [None] * expected_size
     for entry in raw_data:
         if not isinstance(entry, dict):
             raise EmbeddingsRequestError("Each item in 'data' must be an object.")
@@ -90,28 +189,19 @@ def _parse_openai_embeddings_response(
             raise EmbeddingsRequestError(
                 "Each embedding item requires a non-empty 'embedding' list."
             )
-        if not all(isinstance(value, (int, float)) for value in embedding):
-            raise EmbeddingsRequestError(
-                "Embedding vectors must contain only numeric values."
-            )
-
-        indexed_vectors[index] = [float(value) for value in embedding]
-
-    if len(indexed_vectors) != expected_size:
-        raise EmbeddingsRequestError(
-            f"Embeddings response size mismatch: expected {expected_size}, received {len(indexed_vectors)}."
-        )
-
-    missing = [index for index in range(expected_size) if index not in indexed_vectors]
+        if not all(type(value) is float for value in embedding):
+            if not all(isinstance(value, (int, float)) for value in embedding):
+                raise EmbeddingsRequestError(
+                    "Embedding vectors must contain only numeric values."
+                )
+            embedding = [float(value) for value in embedding]
+
+        # Out-of-range or duplicate indices leave a hole reported below.
+        if index < expected_size:
+            vectors[index] = embedding
+
+    missing = [index for index, vector in enumerate(vectors) if vector is None]
     if missing:
         raise EmbeddingsRequestError(f"Embeddings response missing indices: {missing}")
 
-    return [indexed_vectors[index] for index in range(expected_size)]
-
-
-def _read_http_error_body(exc: HTTPError) -> str:
-    try:
-        body = exc.read().decode("utf-8")
-    except OSError:
-        return str(exc.reason)
-    return body or str(exc.reason)
+    return cast(list[list[float]], vectors)
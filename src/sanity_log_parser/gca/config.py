@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import logging
 import math
+import os
 from decimal import Decimal, InvalidOperation
 from dataclasses import dataclass, field
 
@@ -65,16 +66,29 @@ class GcaConfig:
     rules: dict[str, GcaRuleConfig] = field(default_factory=dict)
 
 
+_CONFIG_CACHE: dict[tuple[str, int, int], GcaConfig] = {}
+
+
 def load_gca_config(config_file: str, *, strict: bool = False) -> GcaConfig:
     """Load and validate a GCA config file.
 
     strict=True: raise ConfigError on any failure.
     strict=False: log warning and return defaults on any failure.
+
+    Successfully parsed configs are cached by (path, mtime, size), so
+    reloading an unchanged file returns the same GcaConfig instance.
     """
     try:
+        st = os.stat(config_file)
+        key = (os.path.abspath(config_file), st.st_mtime_ns, st.st_size)
+        cached = _CONFIG_CACHE.get(key)
+        if cached is not None:
+            return cached
         with open(config_file, encoding="utf-8") as f:
             raw = json.load(f)
-        return _parse_gca_config(raw)
+        config = _parse_gca_config(raw)
+        _CONFIG_CACHE[key] = config
+        return config
     except Exception as exc:
         if strict:
             raise ConfigError(str(exc)) from exc
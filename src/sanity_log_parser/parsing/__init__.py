@@ -1,36 +1,43 @@
 from __future__ import annotations
 
-from typing import Any, cast
-
 from .log_parser import SubutaiParser
 from .primetime_parser import PrimeTimeParser
+from .row import ParsedRow
 from .template_manager import RuleTemplateManager
 
+_SKIP_PREFIXES = ("-", "=", "Rule", "Severity")
+_SKIP_FIRST = frozenset("-=RS")
+
 
 def parse_log_file(
     log_file: str,
     template_file: str | None = None,
-) -> list[dict[str, Any]]:
+    *,
+    workers: int = 1,
+) -> list[ParsedRow]:
     """Unified parser entry point.
 
     When *template_file* is falsy, parses *log_file* as a single-file
-    PrimeTime constraint report. Otherwise uses the legacy two-file
-    mode (SubutaiParser + RuleTemplateManager).
+    PrimeTime constraint report, using *workers* processes. Otherwise
+    uses the legacy two-file mode (SubutaiParser + RuleTemplateManager),
+    which always parses sequentially.
     """
     if not template_file:
-        return PrimeTimeParser().parse_file(log_file)
+        return PrimeTimeParser().parse_file(log_file, workers=workers)
 
     tm = RuleTemplateManager(template_file)
     parser = SubutaiParser(tm)
-    parsed_logs: list[dict[str, Any]] = []
+    parsed_logs: list[ParsedRow] = []
 
     with open(log_file, encoding="utf-8", errors="ignore") as f:
         for line in f:
             stripped = line.strip()
-            if not stripped or stripped.startswith(("-", "=", "Rule", "Severity")):
+            if not stripped or (
+                stripped[0] in _SKIP_FIRST and stripped.startswith(_SKIP_PREFIXES)
+            ):
                 continue
             res = parser.parse_line(stripped)
-            if res:
-                parsed_logs.append(cast(dict[str, Any], res))
+            if res is not None:
+                parsed_logs.append(res)
 
     return parsed_logs
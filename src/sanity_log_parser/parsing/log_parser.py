@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-from typing import Any
-
 from ..patterns import INSTANCE_LINE_PATTERN, VAR_PATTERN
+from .row import ParsedRow
 from .template_manager import RuleTemplateManager
 
 
@@ -10,11 +9,9 @@ class SubutaiParser:
     def __init__(self, template_manager: RuleTemplateManager) -> None:
         self.template_manager = template_manager
 
-    def parse_line(self, line: str) -> dict[str, Any] | None:
-        line = line.strip()
-        if not line:
-            return None
-
+    def parse_line(self, line: str) -> ParsedRow | None:
+        # INSTANCE_LINE_PATTERN skips leading whitespace and its message group
+        # ends on a non-space, so no stripped copy of the line is needed.
         match = INSTANCE_LINE_PATTERN.match(line)
         if match is None:
             return None
@@ -27,9 +24,9 @@ class SubutaiParser:
         template = self.template_manager.get_pure_template(line)
         rule_id = self.template_manager.get_rule_id(template, raw_log=line)
 
-        return {
-            "rule_id": rule_id,
-            "variables": var_tuple,
-            "template": template,
-            "raw_log": line,
-        }
+        return ParsedRow(
+            rule_id=rule_id,
+            variables=var_tuple,
+            template=template,
+            raw_log=line,
+        )
@@ -1,27 +1,38 @@
 from __future__ import annotations
 
+import io
 import logging
+import multiprocessing
+import os
 import re
-from typing import Any
+import sys
+from collections.abc import Iterable, Iterator
+from typing import cast
 
 from ..patterns import (
     INSTANCE_LINE_PATTERN,
-    RULE_ID_LINE_PATTERN,
+    PRIMETIME_LINE_PATTERN,
     SEPARATOR_PATTERN,
     SEVERITY_LINE_PATTERN,
     VAR_PATTERN,
 )
-from .template_manager import RuleTemplateManager
+from .row import ParsedRow
+from .template_manager import RuleTemplateManager, normalize_cache_info
 
 logger = logging.getLogger(__name__)
 
+_SEPARATOR_FIRST = frozenset("*=-")
+# Reports can run to gigabytes; read them in large blocks.
+_READ_BUFFER_SIZE = 1 << 20
+_SEVERITY_LINE_BYTES = re.compile(SEVERITY_LINE_PATTERN.pattern.encode(), re.IGNORECASE)
+
 
 class PrimeTimeParser:
     """Stateful single-file PrimeTime constraint report parser.
 
     Walks each line of a report, tracking current_severity and
-    current_rule_id from structural context lines. Emits one parsed
-    dict per instance line (lines matching "N of M").
+    current_rule_id from structural context lines. Emits one ParsedRow
+    per instance line (lines matching "N of M").
     """
 
     def __init__(self) -> None:
@@ -29,88 +40,181 @@ class PrimeTimeParser:
         self.current_severity: str = "unknown"
         self.current_rule_id: str = "UNKNOWN"
 
-    def parse_file(self, path: str) -> list[dict[str, Any]]:
-        """Parse a single PrimeTime report file."""
+    def parse_file(self, path: str, *, workers: int = 1) -> list[ParsedRow]:
+        """Parse a single PrimeTime report file.
+
+        With workers > 1 the report is split at severity-section lines,
+        where all parser state resets, and the sections are parsed in a
+        process pool. Row order is the same as a sequential parse.
+        """
+        if workers > 1:
+            return self._parse_file_parallel(path, workers)
+        return list(self.parse_file_iter(path))
+
+    def parse_file_iter(self, path: str) -> Iterator[ParsedRow]:
+        """Yield parsed rows from a PrimeTime report one at a time.
+
+        Use this instead of parse_file() to stream very large reports
+        without holding every row in memory.
+        """
+        counts = _new_counts()
+        with open(
+            path, encoding="utf-8", errors="ignore", buffering=_READ_BUFFER_SIZE
+        ) as fh:
+            yield from self._parse_lines(fh, counts)
+        _log_counts(counts, path)
+
+    def _parse_lines(
+        self, lines: Iterable[str], counts: dict[str, int]
+    ) -> Iterator[ParsedRow]:
         self.current_severity = "unknown"
         self.current_rule_id = "UNKNOWN"
-        results: list[dict[str, Any]] = []
-
-        counts = {"instances": 0, "severity": 0, "parents": 0, "skipped": 0}
-
-        with open(path, encoding="utf-8", errors="ignore") as fh:
-            for line in fh:
-                parsed = self._process_line(line.rstrip("\n"), counts)
-                if parsed is not None:
-                    results.append(parsed)
-
-        logger.info(
-            "PrimeTimeParser: %d instances, %d severity sections, "
-            "%d parent rules, %d skipped from %s",
-            counts["instances"],
-            counts["severity"],
-            counts["parents"],
-            counts["skipped"],
-            path,
-        )
+        process = self._process_line
+        for line in lines:
+            parsed = process(line.rstrip("\n"), counts)
+            if parsed is not None:
+                yield parsed
+
+    def _parse_file_parallel(self, path: str, workers: int) -> list[ParsedRow]:
+        ranges = _section_ranges(path, workers)
+        if len(ranges) < 2:
+            return list(self.parse_file_iter(path))
+
+        counts = _new_counts()
+        results: list[ParsedRow] = []
+        tasks = [(path, start, end) for start, end in ranges]
+        with multiprocessing.Pool(min(workers, len(ranges))) as pool:
+            chunks = pool.imap(_parse_chunk, tasks)
+            for rows, chunk_counts, severity, rule_id in chunks:
+                for row in rows:
+                    # Strings come back unpickled per row; re-share them.
+                    row.rule_id = sys.intern(row.rule_id)
+                    row.template = sys.intern(row.template)
+                    row.severity = sys.intern(cast(str, row.severity))
+                results.extend(rows)
+                for key, value in chunk_counts.items():
+                    counts[key] += value
+                self.current_severity = severity
+                self.current_rule_id = rule_id
+
+        _log_counts(counts, path)
         return results
 
     def _process_line(
         self,
         line: str,
         counts: dict[str, int],
-    ) -> dict[str, Any] | None:
-        stripped = line.strip()
-
+    ) -> ParsedRow | None:
         # Step 1: Empty / separator
-        if not stripped or SEPARATOR_PATTERN.match(line):
+        # lstrip() copies indented lines, but it is still cheaper than finding
+        # the first non-space character with a regex search.
+        stripped = line.lstrip()
+        if not stripped or (
+            stripped[0] in _SEPARATOR_FIRST and SEPARATOR_PATTERN.match(line)
+        ):
             counts["skipped"] += 1
             return None
 
-        # Step 2: Severity section
-        m = SEVERITY_LINE_PATTERN.match(line)
+        # Steps 2-4: only instance lines start with a digit; everything else
+        # is a severity section or parent line, tried in one match.
+        if stripped[0].isdigit():
+            m = INSTANCE_LINE_PATTERN.match(stripped)
+        else:
+            m = PRIMETIME_LINE_PATTERN.match(line)
         if m:
-            self.current_severity = m.group(1).lower()
+            kind = m.lastgroup
+            if kind == "message":
+                if (
+                    self.current_rule_id == "UNKNOWN"
+                    or self.current_severity == "unknown"
+                ):
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "Skipped orphan instance line without active "
+                            "rule/severity: %s",
+                            line.strip()[:80],
+                        )
+                    counts["skipped"] += 1
+                    return None
+                counts["instances"] += 1
+                return self._parse_instance_line(m)
+            if kind == "rule_id":
+                self.current_rule_id = sys.intern(m.group("rule_id"))
+                counts["parents"] += 1
+                return None
+            self.current_severity = sys.intern(m.group("severity").lower())
             self.current_rule_id = "UNKNOWN"
             counts["severity"] += 1
             return None
 
-        # Step 3: Parent line
-        m = RULE_ID_LINE_PATTERN.match(line)
-        if m:
-            self.current_rule_id = m.group(1)
-            counts["parents"] += 1
-            return None
-
-        # Step 4: Instance line
-        m = INSTANCE_LINE_PATTERN.match(line)
-        if m:
-            if self.current_rule_id == "UNKNOWN" or self.current_severity == "unknown":
-                logger.debug(
-                    "Skipped orphan instance line without active rule/severity: %s",
-                    stripped[:80],
-                )
-                counts["skipped"] += 1
-                return None
-            counts["instances"] += 1
-            return self._parse_instance_line(m)
-
         # Step 5: Skip everything else
         self.current_rule_id = "UNKNOWN"
-        logger.debug("Skipped unrecognized line: %s", stripped[:80])
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Skipped unrecognized line: %s", line.strip()[:80])
         counts["skipped"] += 1
         return None
 
-    def _parse_instance_line(self, match: re.Match[str]) -> dict[str, Any]:
-        message = match.group(4)
+    def _parse_instance_line(self, match: re.Match[str]) -> ParsedRow:
+        message = match.group("message")
 
         variables = VAR_PATTERN.findall(message)
         var_tuple = tuple(variables) if variables else ("NO_VAR",)
         template = self._template_manager.get_pure_template(message)
 
-        return {
-            "rule_id": self.current_rule_id,
-            "variables": var_tuple,
-            "template": template,
-            "raw_log": message,
-            "severity": self.current_severity,
-        }
+        # rule_id/severity are interned when their section starts and the
+        # template is interned by the template manager.
+        return ParsedRow(
+            rule_id=self.current_rule_id,
+            variables=var_tuple,
+            template=template,
+            raw_log=message,
+            severity=self.current_severity,
+        )
+
+
+def _new_counts() -> dict[str, int]:
+    return {"instances": 0, "severity": 0, "parents": 0, "skipped": 0}
+
+
+def _log_counts(counts: dict[str, int], path: str) -> None:
+    logger.info(
+        "PrimeTimeParser: %d instances, %d severity sections, "
+        "%d parent rules, %d skipped from %s",
+        counts["instances"],
+        counts["severity"],
+        counts["parents"],
+        counts["skipped"],
+        path,
+    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Template normalization cache: %s", normalize_cache_info())
+
+
+def _section_ranges(path: str, parts: int) -> list[tuple[int, int]]:
+    """Split *path* into at most *parts* byte ranges starting at severity lines."""
+    size = os.path.getsize(path)
+    target = max(1, size // parts)
+    starts = [0]
+    next_cut = target
+    offset = 0
+    with open(path, "rb") as fh:
+        for line in fh:
+            if offset >= next_cut and _SEVERITY_LINE_BYTES.match(line):
+                starts.append(offset)
+                next_cut = offset + target
+            offset += len(line)
+    return list(zip(starts, starts[1:] + [size]))
+
+
+def _parse_chunk(
+    task: tuple[str, int, int],
+) -> tuple[list[ParsedRow], dict[str, int], str, str]:
+    path, start, end = task
+    with open(path, "rb") as fh:
+        _ = fh.seek(start)
+        data = fh.read(end - start)
+    parser = PrimeTimeParser()
+    counts = _new_counts()
+    lines = io.TextIOWrapper(io.BytesIO(data), encoding="utf-8", errors="ignore")
+    rows = list(parser._parse_lines(lines, counts))
+    return rows, counts, parser.current_severity, parser.current_rule_id
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, fields
+from typing import Any
+
+_MISSING = object()
+
+
+@dataclass(slots=True, eq=False)
+class ParsedRow:
+    """One parsed instance line.
+
+    Slotted to keep per-row memory low on large reports. Supports the
+    read-only mapping access (row["rule_id"], row.get(...)) used by the
+    clustering stages and compares equal to the equivalent dict; convert
+    with as_dict() at serialization edges. severity is None for rows
+    from the legacy two-file parser.
+    """
+
+    rule_id: str
+    variables: tuple[str, ...]
+    template: str
+    raw_log: str
+    severity: str | None = None
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self.get(key, _MISSING) is not _MISSING
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ParsedRow):
+            return self.as_dict() == other.as_dict()
+        if isinstance(other, dict):
+            return self.as_dict() == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key not in _ROW_KEYS:
+            return default
+        value = getattr(self, key)
+        if value is None:
+            return default
+        return value
+
+    def as_dict(self) -> dict[str, Any]:
+        row: dict[str, Any] = {
+            "rule_id": self.rule_id,
+            "variables": self.variables,
+            "template": self.template,
+            "raw_log": self.raw_log,
+        }
+        if self.severity is not None:
+            row["severity"] = self.severity
+        return row
+
+
+_ROW_KEYS = frozenset(f.name for f in fields(ParsedRow))
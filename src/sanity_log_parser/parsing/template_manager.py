@@ -3,51 +3,110 @@ from __future__ import annotations
 import hashlib
 import logging
 import os
+import re
+import sys
+from collections.abc import Iterator
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
-from ..patterns import NUM_PATTERN, VAR_PATTERN
+from ..patterns import TEMPLATE_TOKEN_PATTERN
+
+if TYPE_CHECKING:
+    from functools import _CacheInfo
 
 logger = logging.getLogger(__name__)
 
+_SKIP_PREFIXES = (b"-", b"Rule", b"Severity")
+_SKIP_FIRST = frozenset(b"-RS")
+_SKIP_TEXT_PREFIXES = tuple(prefix.decode() for prefix in _SKIP_PREFIXES)
+
+
+def _token_repl(match: re.Match[str]) -> str:
+    return "'<VAR>'" if match.group(1) is not None else "<NUM>"
+
+
+@lru_cache(maxsize=65536)
+def _normalize(text: str) -> str:
+    return sys.intern(TEMPLATE_TOKEN_PATTERN.sub(_token_repl, text).strip())
+
+
+def normalize_cache_info() -> _CacheInfo:
+    """Hit/miss statistics of the shared template normalization cache."""
+    return _normalize.cache_info()
+
+
+def _unknown_rule_id(template: str) -> str:
+    # Stdlib-only on purpose: an optional faster hash (e.g. xxhash) would make
+    # UNKNOWN_ ids depend on what is installed. A 3-byte digest is exactly
+    # six hex characters.
+    digest = hashlib.blake2b(template.encode(), digest_size=3).hexdigest()
+    return f"UNKNOWN_{digest.upper()}"
+
+
+def _iter_rules(file_path: str) -> Iterator[tuple[str, str]]:
+    """Yield (message, rule_id) pairs from a template file."""
+    with open(file_path, "rb") as handle:
+        data = handle.read()
+    # Filter and split at the bytes level; only surviving fields are decoded.
+    for raw in data.splitlines():
+        if not raw.isascii():
+            # bytes.split() only knows ASCII whitespace; NBSP and other Unicode
+            # separators need the str methods.
+            rule = _split_text_rule(raw.decode("utf-8", "ignore"))
+            if rule is not None:
+                yield rule
+            continue
+        raw = raw.strip()
+        if not raw or (raw[0] in _SKIP_FIRST and raw.startswith(_SKIP_PREFIXES)):
+            continue
+        parts = raw.split(maxsplit=3)
+        if len(parts) < 4:
+            continue
+        message = parts[3].decode("utf-8", "ignore").strip()
+        yield message, parts[0].decode("utf-8", "ignore")
+
+
+def _split_text_rule(line: str) -> tuple[str, str] | None:
+    line = line.strip()
+    if not line or line.startswith(_SKIP_TEXT_PREFIXES):
+        return None
+    parts = line.split(maxsplit=3)
+    if len(parts) < 4:
+        return None
+    return parts[3].strip(), parts[0]
+
 
 class RuleTemplateManager:
     def __init__(self, template_file: str | None) -> None:
         self.template_dict: dict[str, str] = {}
         self.exact_message_dict: dict[str, str] = {}
         self.ambiguous_templates: set[str] = set()
+        self._resolved: dict[str, str] = {}
 
         if template_file:
             logger.info("Loading Rule Templates from: %s", template_file)
             self._load_templates(template_file)
 
     def get_pure_template(self, text: str) -> str:
-        normalized_template = VAR_PATTERN.sub("'<VAR>'", text)
-        normalized_template = NUM_PATTERN.sub("<NUM>", normalized_template)
-        return normalized_template.strip()
+        return _normalize(text)
 
     def _load_templates(self, file_path: str) -> None:
         if not os.path.exists(file_path):
             return
-        with open(file_path, "r", encoding="utf-8", errors="ignore") as handle:
-            for line in handle:
-                line = line.strip()
-                if not line or line.startswith(("-", "Rule", "Severity")):
-                    continue
-                parts = line.split(maxsplit=3)
-                if len(parts) < 4:
-                    continue
-                rule_id, message = parts[0], parts[3]
-                message = message.strip()
-                self.exact_message_dict[message] = rule_id
-                pure_temp = self.get_pure_template(message)
-                if pure_temp in self.ambiguous_templates:
-                    continue
-                existing = self.template_dict.get(pure_temp)
-                if existing is None:
-                    self.template_dict[pure_temp] = rule_id
-                    continue
-                if existing != rule_id:
-                    self.ambiguous_templates.add(pure_temp)
-                    self.template_dict.pop(pure_temp, None)
+        rules = list(_iter_rules(file_path))
+        self.exact_message_dict.update(rules)
+        # Not a plain dict(): a template claimed by two rule ids is ambiguous.
+        for message, rule_id in rules:
+            pure_temp = self.get_pure_template(message)
+            if pure_temp in self.ambiguous_templates:
+                continue
+            existing = self.template_dict.get(pure_temp)
+            if existing is None:
+                self.template_dict[pure_temp] = rule_id
+                continue
+            if existing != rule_id:
+                self.ambiguous_templates.add(pure_temp)
+                self.template_dict.pop(pure_temp, None)
 
     def get_rule_id(self, log_template: str, raw_log: str | None = None) -> str:
         if raw_log is not None:
@@ -55,7 +114,12 @@ class RuleTemplateManager:
             if exact_match is not None:
                 return exact_match
 
-        return self.template_dict.get(
-            log_template,
-            f"UNKNOWN_{hashlib.md5(log_template.encode()).hexdigest()[:6].upper()}",
-        )
+        rule_id = self.template_dict.get(log_template)
+        if rule_id:
+            return rule_id
+        rule_id = self._resolved.get(log_template)
+        if rule_id:
+            return rule_id
+        rule_id = _unknown_rule_id(log_template)
+        self._resolved[log_template] = rule_id
+        return rule_id
@@ -2,16 +2,26 @@ from __future__ import annotations
 
 import re
 
-VAR_PATTERN = re.compile(r"'(.*?)'")
-NUM_PATTERN = re.compile(r"\b\d+\b")
-LINE_COUNTER_PATTERN = re.compile(r"^\s*\d+\s+of\s+\d+\b")
+VAR_PATTERN = re.compile(r"'([^']*)'")
+# Quoted values | standalone numbers in one alternation, for single-pass
+# normalization. ASCII mode: only 0-9 are digits and only ASCII letters, digits
+# and "_" are word characters, so "é5" normalizes to "é<NUM>".
+TEMPLATE_TOKEN_PATTERN = re.compile(r"'([^']*)'|\b\d+\b", re.ASCII)
+LINE_COUNTER_PATTERN = re.compile(r"^\s*\d+\s+of\s+\d+\b", re.ASCII)
 
 # PrimeTime single-file report patterns
 SEPARATOR_PATTERN = re.compile(r"^\s*[*=\-]+\s*$")
 SEVERITY_LINE_PATTERN = re.compile(
-    r"^\s*(error|warning|info)\s+\d+\s+\d+\s*$", re.IGNORECASE
+    r"^\s*(?P<severity>error|warning|info)\s+\d+\s+\d+\s*$", re.IGNORECASE
 )
 RULE_ID_LINE_PATTERN = re.compile(
-    r"^\s{0,6}([A-Z]{2,4}_\d{3,4})\s+\d+(?:\s+\d+(?:\s+\S.*)?)?\s*$"
+    r"^\s{0,6}(?P<rule_id>[A-Z]{2,4}_\d{3,4})\s+\d+(?:\s+\d+(?:\s+\S.*)?)?\s*$"
+)
+INSTANCE_LINE_PATTERN = re.compile(
+    r"^\s*(\d+)\s+of\s+(\d+)\s+(\d+)\s+(?P<message>.*\S)"
+)
+# SEVERITY_LINE | RULE_ID_LINE in one match; dispatch on lastgroup ("severity"
+# or "rule_id"). Instance lines start with a digit and use INSTANCE_LINE_PATTERN.
+PRIMETIME_LINE_PATTERN = re.compile(
+    f"(?i:{SEVERITY_LINE_PATTERN.pattern})|{RULE_ID_LINE_PATTERN.pattern}"
 )
-INSTANCE_LINE_PATTERN = re.compile(r"^\s*(\d+)\s+of\s+(\d+)\s+(\d+)\s+(.*\S)")
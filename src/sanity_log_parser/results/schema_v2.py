@@ -1,8 +1,18 @@
 from __future__ import annotations
 
-import json
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import lru_cache
+from importlib import import_module
+from operator import itemgetter
 from pathlib import Path
-from typing import Literal, NotRequired, TypedDict, cast
+from typing import Any, BinaryIO, Literal, NotRequired, TypedDict, cast
+
+from .. import _json
+from .._util import as_int
+
+# Results files larger than this are streamed by read_results_preview.
+STREAMING_THRESHOLD_BYTES = 10 * 1024 * 1024
 
 
 class RunCounts(TypedDict):
@@ -56,6 +66,22 @@ class ParsedResults(TypedDict):
     groups: list[dict[str, object]]
 
 
+class ResultsPreview(TypedDict):
+    schema_version: int
+    run: RunMetadata | None
+    groups: list[dict[str, object]]
+    total_groups: int
+    total_logs: int
+
+
+@lru_cache(maxsize=1)
+def _get_ijson() -> Any | None:
+    try:
+        return import_module("ijson")
+    except ImportError:
+        return None
+
+
 def write_results_v2(
     path: str | Path,
     run: RunMetadata,
@@ -67,19 +93,22 @@ def write_results_v2(
         "run": run,
         "groups": groups,
     }
-    with Path(path).open("w", encoding="utf-8") as handle:
-        json.dump(payload, handle, indent=indent, ensure_ascii=False)
+    _ = Path(path).write_bytes(_json.dumps(payload, indent=indent))
 
 
 def read_results(path: str | Path) -> ParsedResults:
-    with Path(path).open("r", encoding="utf-8") as handle:
-        loaded = cast(object, json.load(handle))
+    """Load a results file (schema v2 or legacy v1 list).
+
+    Each group's total_count is coerced to an int once here, so callers
+    can sum it without re-validating.
+    """
+    loaded = cast(object, _json.loads(Path(path).read_bytes()))
 
     if isinstance(loaded, list):
         return {
             "schema_version": 1,
             "run": None,
-            "groups": cast(list[dict[str, object]], loaded),
+            "groups": _coerce_total_counts(cast(list[dict[str, object]], loaded)),
         }
 
     if not isinstance(loaded, dict):
@@ -99,5 +128,145 @@ def read_results(path: str | Path) -> ParsedResults:
     return {
         "schema_version": 2,
         "run": cast(RunMetadata, cast(object, run)),
-        "groups": cast(list[dict[str, object]], groups),
+        "groups": _coerce_total_counts(cast(list[dict[str, object]], groups)),
+    }
+
+
+def _coerce_total_counts(groups: list[dict[str, object]]) -> list[dict[str, object]]:
+    for group in groups:
+        count = group.get("total_count")
+        if type(count) is not int:
+            group["total_count"] = as_int(count, 0)
+    return groups
+
+
+def read_results_preview(path: str | Path, top: int) -> ResultsPreview:
+    """Read the first *top* groups plus group and log totals.
+
+    Files above STREAMING_THRESHOLD_BYTES are streamed with ijson when it
+    is installed, so only *top* groups are ever held in memory.
+    """
+    path = Path(path)
+    top = max(0, top)
+    ijson = _get_ijson()
+    if ijson is None or path.stat().st_size <= STREAMING_THRESHOLD_BYTES:
+        parsed = read_results(path)
+        groups = parsed["groups"]
+        return {
+            "schema_version": parsed["schema_version"],
+            "run": parsed["run"],
+            "groups": groups[:top],
+            "total_groups": len(groups),
+            "total_logs": sum(map(itemgetter("total_count"), groups)),
+        }
+
+    with _stream_errors(ijson):
+        schema_version, run, prefix = _read_stream_header(ijson, path)
+        with path.open("rb") as handle:
+            return _collect_preview(
+                ijson.items(handle, prefix, use_float=True), schema_version, run, top
+            )
+
+
+def iter_results_groups(path: str | Path) -> Iterator[dict[str, object]]:
+    """Yield the groups of a results file (schema v2 or legacy v1 list).
+
+    Like read_results_preview, files above STREAMING_THRESHOLD_BYTES are
+    parsed incrementally with ijson when it is installed, so memory stays
+    flat regardless of file size. total_count is coerced as in read_results.
+    """
+    path = Path(path)
+    ijson = _get_ijson()
+    if ijson is None or path.stat().st_size <= STREAMING_THRESHOLD_BYTES:
+        yield from read_results(path)["groups"]
+        return
+
+    with _stream_errors(ijson):
+        _, _, prefix = _read_stream_header(ijson, path)
+        with path.open("rb") as handle:
+            for group in ijson.items(handle, prefix, use_float=True):
+                if isinstance(group, dict):
+                    count = group.get("total_count")
+                    if type(count) is not int:
+                        group["total_count"] = as_int(count, 0)
+                yield group
+
+
+def _read_stream_header(ijson: Any, path: Path) -> tuple[int, RunMetadata | None, str]:
+    """Validate a results file's root; return (schema_version, run, items prefix)."""
+    with path.open("rb") as handle:
+        root = _first_significant_byte(handle)
+    if root == b"[":
+        return 1, None, "item"
+    if root != b"{":
+        raise ValueError(
+            "Results JSON root must be an object (v2) or list (legacy v1)."
+        )
+
+    header: dict[str, object] = {}
+    with path.open("rb") as handle:
+        # run/schema_version are written before groups; stop once both are read.
+        for key, value in ijson.kvitems(handle, "", use_float=True):
+            if key in ("schema_version", "run"):
+                header[key] = value
+            if len(header) == 2:
+                break
+    run = header.get("run")
+    if (
+        header.get("schema_version") != 2
+        or not isinstance(run, dict)
+        or not _has_groups_array(ijson, path)
+    ):
+        raise ValueError(
+            "Invalid schema-v2 results payload: expected schema_version/run/groups."
+        )
+    return 2, cast(RunMetadata, cast(object, run)), "groups.item"
+
+
+def _has_groups_array(ijson: Any, path: Path) -> bool:
+    with path.open("rb") as handle:
+        events = ijson.parse(handle, use_float=True)
+        for prefix, event, value in events:
+            if prefix == "" and event == "map_key" and value == "groups":
+                return next(events)[1] == "start_array"
+    return False
+
+
+@contextmanager
+def _stream_errors(ijson: Any) -> Iterator[None]:
+    # ijson's errors are not ValueErrors; report them like json.loads would.
+    try:
+        yield
+    except ijson.JSONError as exc:
+        raise ValueError(f"Malformed results JSON: {exc}") from exc
+
+
+def _first_significant_byte(handle: BinaryIO) -> bytes:
+    while True:
+        char = handle.read(1)
+        if not char or not char.isspace():
+            return char
+
+
+def _collect_preview(
+    groups: Any, schema_version: int, run: RunMetadata | None, top: int
+) -> ResultsPreview:
+    kept: list[dict[str, object]] = []
+    total_groups = 0
+    total_logs = 0
+    for group in groups:
+        total_groups += 1
+        if isinstance(group, dict):
+            count = group.get("total_count")
+            if type(count) is not int:
+                count = group["total_count"] = as_int(count, 0)
+            total_logs += count
+        if len(kept) < top:
+            kept.append(cast(dict[str, object], group))
+    return {
+        "schema_version": schema_version,
+        "run": run,
+        "groups": kept,
+        "total_groups": total_groups,
+        "total_logs": total_logs,
     }
@@ -1,10 +1,52 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
+from typing import NamedTuple
 
-from ._util import as_int, as_optional_str, as_str, as_str_list, first_non_empty
+from ._util import as_int, as_optional_str, as_str, as_str_list
 from .console import Console
-from .results.schema_v2 import read_results
+from .results.schema_v2 import read_results_preview
+
+
+class _Printer(NamedTuple):
+    """Console formatters bound once per report instead of once per group."""
+
+    section: Callable[[str], str]
+    kv: Callable[[str, object], str]
+    info: Callable[[str], str]
+
+
+@dataclass(frozen=True, slots=True)
+class _GroupView:
+    """Display fields of one results group, validated once on load."""
+
+    rule_id: str
+    group_type: str
+    total_count: int
+    pattern: str
+    template: str
+    merged: int
+    original_logs: list[str]
+
+    @classmethod
+    def from_dict(cls, group: dict[str, object]) -> _GroupView:
+        g = group.get
+        return cls(
+            rule_id=as_str(g("rule_id"), "UNKNOWN"),
+            group_type=as_str(g("group_type"), as_str(g("type"), "logic")),
+            total_count=as_int(g("total_count"), 0),
+            pattern=as_str(g("representative_pattern"), "N/A"),
+            template=(
+                as_optional_str(g("representative_template"))
+                or as_optional_str(g("template"))
+                or "N/A"
+            ),
+            merged=as_int(g("merged_variants_count"), 1),
+            original_logs=as_str_list(g("original_logs")),
+        )
 
 
 def print_report(
@@ -20,75 +62,78 @@ def print_report(
         return 1
 
     try:
-        parsed = read_results(path)
+        parsed = read_results_preview(path, top)
     except (OSError, ValueError) as exc:
         console.error(f"Failed to load results JSON: {exc}")
         return 1
 
-    groups = parsed["groups"]
-    total_groups = len(groups)
-    total_logs = sum(as_int(group.get("total_count"), 0) for group in groups)
-    shown = min(total_groups, max(0, top))
+    groups = [_GroupView.from_dict(group) for group in parsed["groups"]]
+    total_groups = parsed["total_groups"]
+    total_logs = parsed["total_logs"]
+    shown = len(groups)
+    printer = _Printer(
+        console.format_section,
+        console.format_kv,
+        console.format_info,
+    )
+    section, kv, info = printer
 
-    console.section("Subutai Analysis Report")
-    console.kv("File", str(path))
-    console.kv("Schema version", parsed["schema_version"])
-    console.kv("Total logs", f"{total_logs:,}")
-    console.kv("Groups", f"{total_groups:,}")
-    console.kv("Top shown", f"{shown:,}")
+    # The whole report is collected and written with one call.
+    out = [
+        section("Subutai Analysis Report"),
+        kv("File", str(path)),
+        kv("Schema version", parsed["schema_version"]),
+        kv("Total logs", f"{total_logs:,}"),
+        kv("Groups", f"{total_groups:,}"),
+        kv("Top shown", f"{shown:,}"),
+    ]
 
     run = parsed.get("run")
     if run is not None:
         counts = run["counts"]
         ai = run["ai"]
-        console.section("Run metadata")
-        console.kv("Timestamp (UTC)", run["timestamp_utc"])
-        console.kv("Log file", run["log_file"])
+        out.append(section("Run metadata"))
+        out.append(kv("Timestamp (UTC)", run["timestamp_utc"]))
+        out.append(kv("Log file", run["log_file"]))
         template_file = run.get("template_file")
         if template_file:
-            console.kv("Template file", template_file)
-        console.kv("Parsed logs", counts["parsed_logs"])
-        console.kv("Logic groups", counts["logic_groups"])
-        console.kv("Final groups", counts["final_groups"])
-        console.kv("AI enabled", ai["enabled"])
-        console.kv("AI backend", ai["backend"] if ai["backend"] is not None else "N/A")
-        if ai["warnings"]:
-            for warning in ai["warnings"]:
-                console.warn(warning)
-
-    for index, group in enumerate(groups[:shown], start=1):
-        _print_group(console, index, group)
+            out.append(kv("Template file", template_file))
+        out.append(kv("Parsed logs", counts["parsed_logs"]))
+        out.append(kv("Logic groups", counts["logic_groups"]))
+        out.append(kv("Final groups", counts["final_groups"]))
+        out.append(kv("AI enabled", ai["enabled"]))
+        out.append(
+            kv("AI backend", ai["backend"] if ai["backend"] is not None else "N/A")
+        )
+        out.extend(console.format_warn(warning) for warning in ai["warnings"])
+
+    for index, group in enumerate(groups, start=1):
+        _format_group(printer, index, group, out)
 
     if total_groups > shown:
-        console.info(
-            f"... omitted {total_groups - shown:,} groups (use --top to increase)"
+        out.append(
+            info(f"... omitted {total_groups - shown:,} groups (use --top to increase)")
         )
+    console.write_block(out)
     return 0
 
 
-def _print_group(console: Console, rank: int, group: dict[str, object]) -> None:
-    rule_id = as_str(group.get("rule_id"), "UNKNOWN")
-    group_type = as_str(group.get("group_type"), as_str(group.get("type"), "logic"))
-    total_count = as_int(group.get("total_count"), 0)
-    pattern = as_str(group.get("representative_pattern"), "N/A")
-    template = first_non_empty(
-        as_optional_str(group.get("representative_template")),
-        as_optional_str(group.get("template")),
-        "N/A",
-    )
-    merged = as_int(group.get("merged_variants_count"), 1)
-    original_logs = as_str_list(group.get("original_logs"))
-
-    console.section(f"[{rank:02d}] {rule_id}")
-    console.kv("Group type", group_type)
-    console.kv("Count", f"{total_count:,}")
-    console.kv("Merged variants", merged)
-    console.kv("Pattern", pattern)
-    console.kv("Template", template)
-    console.kv("Original logs", len(original_logs))
-
-    preview_limit = min(5, len(original_logs))
-    for log in original_logs[:preview_limit]:
-        console.info(f"- {log}")
-    if len(original_logs) > preview_limit:
-        console.info(f"... (+{len(original_logs) - preview_limit:,} more)")
+def _format_group(
+    printer: _Printer, rank: int, group: _GroupView, out: list[str]
+) -> None:
+    section, kv, info = printer
+    original_logs = group.original_logs
+
+    out.append(section(f"[{rank:02d}] {group.rule_id}"))
+    out.append(kv("Group type", group.group_type))
+    out.append(kv("Count", f"{group.total_count:,}"))
+    out.append(kv("Merged variants", group.merged))
+    out.append(kv("Pattern", group.pattern))
+    out.append(kv("Template", group.template))
+    n_logs = len(original_logs)
+    out.append(kv("Original logs", n_logs))
+
+    preview_limit = min(5, n_logs)
+    out.extend(info(f"- {log}") for log in islice(original_logs, preview_limit))
+    if n_logs > preview_limit:
+        out.append(info(f"... (+{n_logs - preview_limit:,} more)"))
@@ -0,0 +1,125 @@
+"""Shared helpers for running the sanity-log-parser CLI from tests."""
+
+import argparse
+import contextlib
+import io
+import logging
+import os
+import subprocess
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+from unittest import mock
+
+from sanity_log_parser import cli
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Set SLP_TEST_SUBPROCESS=1 to run every CLI test in a fresh interpreter.
+_USE_SUBPROCESS = os.environ.get("SLP_TEST_SUBPROCESS") == "1"
+
+
+def _cli_env(set_no_color: bool) -> dict[str, str]:
+    env = os.environ.copy()
+    if set_no_color:
+        env["NO_COLOR"] = "1"
+    else:
+        if "NO_COLOR" in env:
+            del env["NO_COLOR"]
+    if _USE_SUBPROCESS:
+        env["PYTHONPATH"] = str(ROOT / "src")
+        env["PYTHONUTF8"] = "1"
+    return env
+
+
+def run_cli(
+    args: list[str],
+    cwd: Path,
+    parser: argparse.ArgumentParser,
+    *,
+    set_no_color: bool = True,
+) -> subprocess.CompletedProcess[str]:
+    env = _cli_env(set_no_color)
+    if _USE_SUBPROCESS:
+        return subprocess.run(
+            [sys.executable, "-m", "sanity_log_parser", *args],
+            cwd=cwd,
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+    return _run_cli_in_process(args, cwd, env, parser)
+
+
+def run_cli_concurrently(
+    arg_lists: list[list[str]], cwd: Path, parser: argparse.ArgumentParser
+) -> list[subprocess.CompletedProcess[str]]:
+    """Run independent CLI invocations, overlapping them in subprocess mode.
+
+    In-process runs stay sequential: they share cwd and sys.stdout/stderr.
+    """
+    if not _USE_SUBPROCESS:
+        return [run_cli(args, cwd, parser) for args in arg_lists]
+    env = _cli_env(set_no_color=True)
+    procs = [
+        subprocess.Popen(
+            [sys.executable, "-m", "sanity_log_parser", *args],
+            cwd=cwd,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        for args in arg_lists
+    ]
+    results = []
+    for proc in procs:
+        stdout, stderr = proc.communicate()
+        results.append(
+            subprocess.CompletedProcess(proc.args, proc.returncode, stdout, stderr)
+        )
+    return results
+
+
+def _run_cli_in_process(
+    args: list[str],
+    cwd: Path,
+    env: dict[str, str],
+    parser: argparse.ArgumentParser,
+) -> subprocess.CompletedProcess[str]:
+    """Call cli.main in this interpreter, capturing output like subprocess.run."""
+    out = io.StringIO()
+    err = io.StringIO()
+    with (
+        mock.patch.dict(os.environ, env, clear=True),
+        contextlib.chdir(cwd),
+        contextlib.redirect_stdout(out),
+        contextlib.redirect_stderr(err),
+        _isolated_root_logger(),
+    ):
+        try:
+            code = cli.main(args, parser)
+        except SystemExit as exc:
+            code = exc.code if isinstance(exc.code, int) else 1
+    return subprocess.CompletedProcess(
+        ["sanity_log_parser", *args], code, out.getvalue(), err.getvalue()
+    )
+
+
+@contextlib.contextmanager
+def _isolated_root_logger() -> Iterator[None]:
+    """Let each run's logging.basicConfig attach to that run's stderr."""
+    root = logging.getLogger()
+    handlers = root.handlers[:]
+    level = root.level
+    root.handlers.clear()
+    try:
+        yield
+    finally:
+        root.handlers[:] = handlers
+        root.setLevel(level)
+
+
+def output_of(process: subprocess.CompletedProcess[str]) -> str:
+    return (process.stdout or "") + (process.stderr or "")
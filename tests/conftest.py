@@ -1,13 +1,8 @@
-from pathlib import Path
-import sys
+import argparse
 
 import pytest
 
-ROOT = Path(__file__).resolve().parents[1]
-SRC = ROOT / "src"
-if str(SRC) not in sys.path:
-    sys.path.insert(0, str(SRC))
-
+from sanity_log_parser.cli import _build_parser
 from sanity_log_parser.clustering.ai.clusterer import AIClusterer
 from sanity_log_parser.parsing.template_manager import RuleTemplateManager
 from sanity_log_parser.parsing.log_parser import SubutaiParser
@@ -52,3 +47,9 @@ def sample_non_matching_line():
 @pytest.fixture
 def ai_clusterer_no_init():
     return AIClusterer.__new__(AIClusterer)
+
+
+@pytest.fixture(scope="session")
+def cli_parser() -> argparse.ArgumentParser:
+    # parse_args does not mutate the parser, so one instance serves every test.
+    return _build_parser()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import math
+from functools import lru_cache
 from unittest.mock import MagicMock, patch
 
 import numpy as np
@@ -31,16 +32,53 @@ def _make_logic_group(
     }
 
 
+def _paired_groups(n_rules: int) -> list[dict]:
+    """Two logic groups (counts 2 and 1) for each of *n_rules* rules."""
+    groups = []
+    for i in range(n_rules):
+        groups.append(
+            _make_logic_group(f"R{i}", f"tmpl_{i}_a", f"'v{i}a' rest", count=2)
+        )
+        groups.append(
+            _make_logic_group(f"R{i}", f"tmpl_{i}_b", f"'v{i}b' rest", count=1)
+        )
+    return groups
+
+
+@pytest.fixture(scope="module")
+def large_600_groups() -> list[dict]:
+    # 300 rules x 2 groups = 600 template texts. AIClusterer.run only reads
+    # its input groups, so the list is shared rather than copied per test.
+    return _paired_groups(300)
+
+
 def _fake_embed(texts: list[str]) -> np.ndarray:
     """Return deterministic embeddings based on text hash — 4-dim vectors."""
-    rng = np.random.default_rng(42)
-    embs = []
-    for t in texts:
-        seed = hash(t) % (2**31)
-        embs.append(rng.standard_normal(4) + seed * 0.001)
-    result = np.array(embs)
-    norms = np.linalg.norm(result, axis=1, keepdims=True)
-    return result / norms
+    # Copy so callers can mutate the result without corrupting the cache.
+    return _embed_cached(tuple(texts)).copy()
+
+
+_UNIT_VEC = np.array([1.0, 0.0, 0.0, 0.0])
+
+
+def _const_embed(texts: list[str]) -> np.ndarray:
+    """Return the same unit vector for every text.
+
+    For tests that only check call counts and totals, where embedding
+    content does not matter.
+    """
+    return np.broadcast_to(_UNIT_VEC, (len(texts), 4)).copy()
+
+
+@lru_cache(maxsize=None)
+def _embed_cached(texts: tuple[str, ...]) -> np.ndarray:
+    seeds = np.fromiter(
+        (hash(t) % (2**31) for t in texts), dtype=np.int64, count=len(texts)
+    )
+    result = np.random.default_rng(42).standard_normal((len(texts), 4))
+    result += (seeds * 0.001)[:, None]
+    result /= np.linalg.norm(result, axis=1, keepdims=True)
+    return result
 
 
 def _make_clusterer(
@@ -202,14 +240,7 @@ class TestBatchTemplateOnly:
         clusterer._compute_embeddings = MagicMock(side_effect=_fake_embed)
 
         # 5 rules x 2 groups → old code = 5 calls, new code = 1 call (10 texts < 512)
-        groups = []
-        for i in range(5):
-            groups.append(
-                _make_logic_group(f"R{i}", f"tmpl_{i}_a", f"'v{i}a' rest", count=2)
-            )
-            groups.append(
-                _make_logic_group(f"R{i}", f"tmpl_{i}_b", f"'v{i}b' rest", count=1)
-            )
+        groups = _paired_groups(5)
 
         result = clusterer.run(groups)
 
@@ -222,22 +253,12 @@ class TestBatchTemplateOnly:
 class TestBatchChunking:
     """Test that large batches get split at _EMBED_BATCH_SIZE boundary."""
 
-    def test_batch_large_batch_chunked(self) -> None:
+    def test_batch_large_batch_chunked(self, large_600_groups: list[dict]) -> None:
         """600 texts with batch_size=512: verify 2 embed calls, results concatenated."""
         clusterer = _make_clusterer(gca_config=None)
-        clusterer._compute_embeddings = MagicMock(side_effect=_fake_embed)
+        clusterer._compute_embeddings = MagicMock(side_effect=_const_embed)
 
-        # Create 300 rules x 2 groups = 600 template texts
-        groups = []
-        for i in range(300):
-            groups.append(
-                _make_logic_group(f"R{i}", f"tmpl_{i}_a", f"'v{i}a' rest", count=2)
-            )
-            groups.append(
-                _make_logic_group(f"R{i}", f"tmpl_{i}_b", f"'v{i}b' rest", count=1)
-            )
-
-        result = clusterer.run(groups)
+        result = clusterer.run(large_600_groups)
 
         expected_calls = math.ceil(600 / _EMBED_BATCH_SIZE)
         call_count = clusterer._compute_embeddings.call_count
@@ -251,17 +272,10 @@ class TestBatchChunking:
         """Custom embed_batch_size splits at the configured boundary."""
         clusterer = _make_clusterer(gca_config=None)
         clusterer.embed_batch_size = 4  # very small batch
-        clusterer._compute_embeddings = MagicMock(side_effect=_fake_embed)
+        clusterer._compute_embeddings = MagicMock(side_effect=_const_embed)
 
         # 5 rules x 2 groups = 10 template texts → ceil(10/4) = 3 chunks
-        groups = []
-        for i in range(5):
-            groups.append(
-                _make_logic_group(f"R{i}", f"tmpl_{i}_a", f"'v{i}a' rest", count=2)
-            )
-            groups.append(
-                _make_logic_group(f"R{i}", f"tmpl_{i}_b", f"'v{i}b' rest", count=1)
-            )
+        groups = _paired_groups(5)
 
         result = clusterer.run(groups)
 
@@ -315,3 +329,20 @@ class TestBatchChunking:
         assert ["a", "b"] in seen_chunks
         assert ["c", "d"] in seen_chunks
         assert clusterer.ai_available is True
+
+    def test_remote_client_uses_configured_batch_size(self) -> None:
+        """The remote client must not split a configured batch any further."""
+        pytest.importorskip("sklearn")
+        settings = MagicMock(
+            base_url="http://localhost:8000/v1", model="m", api_key=None
+        )
+        with patch(
+            "sanity_log_parser.clustering.ai.clusterer.load_embeddings_config"
+        ) as mock_cfg:
+            mock_cfg.return_value = MagicMock(
+                backend="openai_compatible", openai_compatible=settings
+            )
+            clusterer = AIClusterer(embed_batch_size=1024)
+
+        assert clusterer.remote_embeddings_client is not None
+        assert clusterer.remote_embeddings_client.batch_size == 1024
@@ -1,41 +1,23 @@
 import json
 import re
-import os
-import subprocess
-import sys
 from pathlib import Path
 
+from sanity_log_parser import _json
+
+from ._cli_helpers import output_of, run_cli, run_cli_concurrently
 
-ROOT = Path(__file__).resolve().parents[1]
-
-
-def _run_main(
-    args: list[str], cwd: Path, *, set_no_color: bool = True
-) -> subprocess.CompletedProcess[str]:
-    env = os.environ.copy()
-    env["PYTHONPATH"] = str(ROOT / "src")
-    if set_no_color:
-        env["NO_COLOR"] = "1"
-    else:
-        if "NO_COLOR" in env:
-            del env["NO_COLOR"]
-    env["PYTHONUTF8"] = "1"
-    return subprocess.run(
-        [sys.executable, "-m", "sanity_log_parser", *args],
-        cwd=cwd,
-        env=env,
-        capture_output=True,
-        text=True,
-    )
 
+_INPUT_LOGS_RE = re.compile(r"Input logs:\s+(\d+)")
 
-def _output(process: subprocess.CompletedProcess[str]) -> str:
-    return (process.stdout or "") + (process.stderr or "")
 
+def _input_logs(output: str) -> int | None:
+    match = _INPUT_LOGS_RE.search(output)
+    return int(match.group(1)) if match else None
 
-def test_main_help_includes_usage_and_argument_placeholders(tmp_path: Path):
-    process = _run_main(["cluster", "--help"], tmp_path)
-    output = _output(process)
+
+def test_main_help_includes_usage_and_argument_placeholders(tmp_path: Path, cli_parser):
+    process = run_cli(["cluster", "--help"], tmp_path, cli_parser)
+    output = output_of(process)
 
     assert process.returncode == 0
     assert "usage:" in output
@@ -44,31 +26,45 @@ def test_main_help_includes_usage_and_argument_placeholders(tmp_path: Path):
     assert "--config" in output
 
 
-def test_main_no_color_help_has_no_escape_codes(tmp_path: Path):
-    process = _run_main(["cluster", "--help"], tmp_path)
-    output = _output(process)
+def test_main_no_color_help_has_no_escape_codes(tmp_path: Path, cli_parser):
+    process = run_cli(["cluster", "--help"], tmp_path, cli_parser)
+    output = output_of(process)
 
     assert "\x1b[" not in output
 
 
-def test_main_no_color_flag_has_no_escape_codes_without_no_color_env(tmp_path: Path):
-    process = _run_main(
-        ["cluster", "--help", "--no-color"], tmp_path, set_no_color=False
+def test_main_no_color_flag_has_no_escape_codes_without_no_color_env(
+    tmp_path: Path, cli_parser
+):
+    process = run_cli(
+        ["cluster", "--help", "--no-color"],
+        tmp_path,
+        cli_parser,
+        set_no_color=False,
     )
-    output = _output(process)
+    output = output_of(process)
 
     assert "\x1b[" not in output
 
 
-def test_main_requires_at_least_log_file(tmp_path: Path):
-    process = _run_main(["cluster"], tmp_path)
-    output = _output(process)
+def test_main_requires_at_least_log_file(tmp_path: Path, cli_parser):
+    process = run_cli(["cluster"], tmp_path, cli_parser)
+    output = output_of(process)
 
     assert process.returncode != 0
     assert "usage:" in output
 
 
-def test_main_empty_input_runs_zero_logs(tmp_path: Path):
+def test_main_rejects_non_positive_jobs(tmp_path: Path, cli_parser):
+    for jobs in ("0", "-3"):
+        process = run_cli(["gca", "report.rpt", "--jobs", jobs], tmp_path, cli_parser)
+        output = output_of(process)
+
+        assert process.returncode == 2
+        assert f"argument -j/--jobs: must be at least 1, got {jobs}" in output
+
+
+def test_main_empty_input_runs_zero_logs(tmp_path: Path, cli_parser):
     template_file = tmp_path / "rules.log"
     _ = template_file.write_text(
         "\n".join(
@@ -82,15 +78,17 @@ def test_main_empty_input_runs_zero_logs(tmp_path: Path):
     log_file = tmp_path / "empty.log"
     _ = log_file.write_text("", encoding="utf-8")
 
-    process = _run_main(["cluster", str(log_file), str(template_file)], tmp_path)
-    output = _output(process)
+    process = run_cli(
+        ["cluster", str(log_file), str(template_file)], tmp_path, cli_parser
+    )
+    output = output_of(process)
 
     assert process.returncode == 0
-    assert re.search(r"Input logs:\s+0", output)
+    assert _input_logs(output) == 0
     assert "Traceback" not in output
 
 
-def test_main_single_file_primetime_mode(tmp_path: Path):
+def test_main_single_file_primetime_mode(tmp_path: Path, cli_parser):
     """cluster command works with only LOG_FILE (no TEMPLATE_FILE)."""
     rpt = tmp_path / "sample.rpt"
     rpt.write_text(
@@ -99,15 +97,15 @@ def test_main_single_file_primetime_mode(tmp_path: Path):
         "       1 of 1          0    Clock 'GEN_A' from 'MSTR'\n",
         encoding="utf-8",
     )
-    process = _run_main(["cluster", str(rpt)], tmp_path)
-    output = _output(process)
+    process = run_cli(["cluster", str(rpt)], tmp_path, cli_parser)
+    output = output_of(process)
 
     assert process.returncode == 0
-    assert re.search(r"Input logs:\s+1", output)
+    assert _input_logs(output) == 1
     assert "Traceback" not in output
 
 
-def test_main_legacy_two_file_mode_still_works(tmp_path: Path):
+def test_main_legacy_two_file_mode_still_works(tmp_path: Path, cli_parser):
     """cluster command still works with LOG_FILE + TEMPLATE_FILE."""
     template_file = tmp_path / "rules.log"
     template_file.write_text(
@@ -119,15 +117,17 @@ def test_main_legacy_two_file_mode_still_works(tmp_path: Path):
         "4 of 4 0 Signal 'u_top' not found\n",
         encoding="utf-8",
     )
-    process = _run_main(["cluster", str(log_file), str(template_file)], tmp_path)
-    output = _output(process)
+    process = run_cli(
+        ["cluster", str(log_file), str(template_file)], tmp_path, cli_parser
+    )
+    output = output_of(process)
 
     assert process.returncode == 0
-    assert re.search(r"Input logs:\s+1", output)
+    assert _input_logs(output) == 1
     assert "Traceback" not in output
 
 
-def test_main_accepts_custom_config_path(tmp_path: Path):
+def test_main_accepts_custom_config_path(tmp_path: Path, cli_parser):
     config_file = tmp_path / "custom-config.json"
     _ = config_file.write_text('{"embeddings_backend": "local"}', encoding="utf-8")
 
@@ -144,14 +144,15 @@ def test_main_accepts_custom_config_path(tmp_path: Path):
     log_file = tmp_path / "empty.log"
     _ = log_file.write_text("", encoding="utf-8")
 
-    process = _run_main(
+    process = run_cli(
         ["cluster", str(log_file), str(template_file), "--config", str(config_file)],
         tmp_path,
+        cli_parser,
     )
-    output = _output(process)
+    output = output_of(process)
 
     assert process.returncode == 0
-    assert re.search(r"Input logs:\s+0", output)
+    assert _input_logs(output) == 0
     assert "Traceback" not in output
 
 
@@ -166,17 +167,17 @@ def _sample_rpt_content() -> str:
     )
 
 
-def test_main_gca_subcommand(tmp_path: Path):
+def test_main_gca_subcommand(tmp_path: Path, cli_parser):
     """gca REPORT_FILE succeeds and produces output with sanity_item in metadata."""
     rpt = tmp_path / "sample.rpt"
     rpt.write_text(_sample_rpt_content(), encoding="utf-8")
     out_file = tmp_path / "gca_results.json"
 
-    process = _run_main(["gca", str(rpt), "--out", str(out_file)], tmp_path)
-    output = _output(process)
+    process = run_cli(["gca", str(rpt), "--out", str(out_file)], tmp_path, cli_parser)
+    output = output_of(process)
 
     assert process.returncode == 0
-    assert re.search(r"Input logs:\s+1", output)
+    assert _input_logs(output) == 1
     assert "Traceback" not in output
 
     with out_file.open("r", encoding="utf-8") as f:
@@ -184,16 +185,16 @@ def test_main_gca_subcommand(tmp_path: Path):
     assert payload["run"]["sanity_item"] == "gca"
 
 
-def test_main_gca_missing_file(tmp_path: Path):
+def test_main_gca_missing_file(tmp_path: Path, cli_parser):
     """gca NONEXISTENT → exit 1, stderr contains 'Error', no traceback."""
-    process = _run_main(["gca", "NONEXISTENT_FILE.rpt"], tmp_path)
+    process = run_cli(["gca", "NONEXISTENT_FILE.rpt"], tmp_path, cli_parser)
 
     assert process.returncode == 1
     assert "Error" in (process.stderr or "")
-    assert "Traceback" not in _output(process)
+    assert "Traceback" not in output_of(process)
 
 
-def test_main_gca_and_cluster_output_parity(tmp_path: Path):
+def test_main_gca_and_cluster_output_parity(tmp_path: Path, cli_parser):
     """gca and cluster on same report produce identical groups (except group_id)."""
     rpt = tmp_path / "sample.rpt"
     rpt.write_text(_sample_rpt_content(), encoding="utf-8")
@@ -201,18 +202,21 @@ def test_main_gca_and_cluster_output_parity(tmp_path: Path):
     gca_out = tmp_path / "gca.json"
     cluster_out = tmp_path / "cluster.json"
 
-    p_gca = _run_main(["gca", str(rpt), "--out", str(gca_out), "--ai", "off"], tmp_path)
-    p_cluster = _run_main(
-        ["cluster", str(rpt), "--out", str(cluster_out), "--ai", "off"], tmp_path
+    # Output paths are disjoint, so the two runs can overlap.
+    p_gca, p_cluster = run_cli_concurrently(
+        [
+            ["gca", str(rpt), "--out", str(gca_out), "--ai", "off"],
+            ["cluster", str(rpt), "--out", str(cluster_out), "--ai", "off"],
+        ],
+        tmp_path,
+        cli_parser,
     )
 
     assert p_gca.returncode == 0
     assert p_cluster.returncode == 0
 
-    with gca_out.open("r", encoding="utf-8") as f:
-        gca_groups = json.load(f)["groups"]
-    with cluster_out.open("r", encoding="utf-8") as f:
-        cluster_groups = json.load(f)["groups"]
+    gca_groups = _json.loads(gca_out.read_bytes())["groups"]
+    cluster_groups = _json.loads(cluster_out.read_bytes())["groups"]
 
     assert len(gca_groups) == len(cluster_groups)
 
@@ -233,36 +237,63 @@ def test_main_gca_and_cluster_output_parity(tmp_path: Path):
             assert g[key] == c[key], f"Mismatch on {key}: {g[key]} != {c[key]}"
 
 
-def test_main_gca_exit_code_on_parse_error(tmp_path: Path):
+def test_main_gca_jobs_matches_sequential_output(tmp_path: Path, cli_parser):
+    """--jobs N parses the report in sections and yields the same groups."""
+    rpt = tmp_path / "multi.rpt"
+    rpt.write_text(
+        "".join(
+            f" {'error' if i % 2 == 0 else 'warning'}    2   0\n"
+            f"  CGR_{i:04d}    2   0 Msg 'a'\n"
+            f"       1 of 2     0    First 'sig_{i}' value {i}\n"
+            f"       2 of 2     0    Second 'sig_{i}'\n"
+            for i in range(6)
+        ),
+        encoding="utf-8",
+    )
+    outputs = []
+    for jobs in ("1", "3"):
+        out_file = tmp_path / f"jobs_{jobs}.json"
+        process = run_cli(
+            ["gca", str(rpt), "--out", str(out_file), "--ai", "off", "--jobs", jobs],
+            tmp_path,
+            cli_parser,
+        )
+        assert process.returncode == 0, output_of(process)
+        outputs.append(_json.loads(out_file.read_bytes())["groups"])
+
+    assert len(outputs[0]) == 12
+    assert outputs[1] == outputs[0]
+
+
+def test_main_gca_exit_code_on_parse_error(tmp_path: Path, cli_parser):
     """Empty/malformed file → exit 1 or 0 with 0 logs, but never a traceback."""
     bad_file = tmp_path / "bad.rpt"
     bad_file.write_text("", encoding="utf-8")
 
-    process = _run_main(["gca", str(bad_file)], tmp_path)
+    process = run_cli(["gca", str(bad_file)], tmp_path, cli_parser)
 
-    assert "Traceback" not in _output(process)
+    assert "Traceback" not in output_of(process)
 
 
-def test_gca_strict_rule_config_failure(tmp_path: Path):
+def test_gca_strict_rule_config_failure(tmp_path: Path, cli_parser):
     """gca with --rule-config pointing to malformed JSON → exit 1, stderr has 'Error'."""
     rpt = tmp_path / "sample.rpt"
     rpt.write_text(_sample_rpt_content(), encoding="utf-8")
     bad_config = tmp_path / "bad_config.json"
     bad_config.write_text("{not valid json", encoding="utf-8")
 
-    process = _run_main(["gca", str(rpt), "--rule-config", str(bad_config)], tmp_path)
+    process = run_cli(
+        ["gca", str(rpt), "--rule-config", str(bad_config)], tmp_path, cli_parser
+    )
 
     assert process.returncode == 1
     assert "Error" in (process.stderr or "")
-    assert "Traceback" not in _output(process)
+    assert "Traceback" not in output_of(process)
 
 
-def test_cluster_defaults_unchanged():
+def test_cluster_defaults_unchanged(cli_parser):
     """Regression: cluster subparser defaults and choices are unchanged."""
-    sys.path.insert(0, str(ROOT / "src"))
-    from sanity_log_parser.cli import _build_parser
-
-    parser = _build_parser()
+    parser = cli_parser
     args = parser.parse_args(["cluster", "LOG", "TEMPLATE"])
 
     assert args.out == "subutai_results.json"
@@ -273,6 +304,7 @@ def test_cluster_defaults_unchanged():
     assert args.rule_config is None
     assert args.no_color is False
     assert args.verbose is False
+    assert args.jobs == 1
 
     # Verify ai choices
     for action in parser._subparsers._group_actions:
@@ -284,9 +316,9 @@ def test_cluster_defaults_unchanged():
                 assert set(ai_action.choices) == {"auto", "on", "off"}
 
 
-def test_gca_fit_adaptive_eps_subcommand_help(tmp_path: Path):
-    process = _run_main(["gca-fit-adaptive-eps", "--help"], tmp_path)
-    output = _output(process)
+def test_gca_fit_adaptive_eps_subcommand_help(tmp_path: Path, cli_parser):
+    process = run_cli(["gca-fit-adaptive-eps", "--help"], tmp_path, cli_parser)
+    output = output_of(process)
 
     assert process.returncode == 0
     assert "--logic" in output
@@ -295,9 +327,9 @@ def test_gca_fit_adaptive_eps_subcommand_help(tmp_path: Path):
     assert "--features-json" in output
 
 
-def test_gca_fit_weights_subcommand_help(tmp_path: Path):
-    process = _run_main(["gca-fit-weights", "--help"], tmp_path)
-    output = _output(process)
+def test_gca_fit_weights_subcommand_help(tmp_path: Path, cli_parser):
+    process = run_cli(["gca-fit-weights", "--help"], tmp_path, cli_parser)
+    output = output_of(process)
 
     assert process.returncode == 0
     assert "--logic" in output
@@ -307,11 +339,8 @@ def test_gca_fit_weights_subcommand_help(tmp_path: Path):
     assert "--variables" in output
 
 
-def test_gca_fit_weights_parser_defaults() -> None:
-    sys.path.insert(0, str(ROOT / "src"))
-    from sanity_log_parser.cli import _build_parser
-
-    parser = _build_parser()
+def test_gca_fit_weights_parser_defaults(cli_parser) -> None:
+    parser = cli_parser
     args = parser.parse_args(
         [
             "gca-fit-weights",
@@ -334,11 +363,8 @@ def test_gca_fit_weights_parser_defaults() -> None:
     assert args.embeddings_config is None
 
 
-def test_gca_fit_adaptive_eps_parser_defaults() -> None:
-    sys.path.insert(0, str(ROOT / "src"))
-    from sanity_log_parser.cli import _build_parser
-
-    parser = _build_parser()
+def test_gca_fit_adaptive_eps_parser_defaults(cli_parser) -> None:
+    parser = cli_parser
     args = parser.parse_args(
         [
             "gca-fit-adaptive-eps",
@@ -360,3 +386,15 @@ def test_gca_fit_adaptive_eps_parser_defaults() -> None:
     assert args.max_min_samples_leaf == 15
     assert args.round_decimals == 3
     assert args.min_eps == 0.001
+
+
+def test_main_repeated_runs_each_capture_log_output(tmp_path: Path, cli_parser):
+    rpt = tmp_path / "sample.rpt"
+    rpt.write_text(_sample_rpt_content(), encoding="utf-8")
+    args = ["gca", str(rpt), "--out", str(tmp_path / "out.json"), "--verbose"]
+
+    first = run_cli(args, tmp_path, cli_parser)
+    second = run_cli(args, tmp_path, cli_parser)
+
+    assert "INFO:" in first.stderr
+    assert second.stderr.count("INFO:") == first.stderr.count("INFO:")
@@ -96,6 +96,17 @@ def test_load_gca_config_with_rules(tmp_path: Path) -> None:
     assert rule.variables[1] == VariableConfig(weight=0.2, levels=[-2, -1])
 
 
+def test_load_gca_config_reuses_instance_for_unchanged_file(tmp_path: Path) -> None:
+    path = _write_config(tmp_path, {"default_eps": 0.3})
+    first = load_gca_config(path, strict=True)
+    assert load_gca_config(path, strict=True) is first
+
+    _ = Path(path).write_text(json.dumps({"default_eps": 0.45}), encoding="utf-8")
+    reloaded = load_gca_config(path, strict=True)
+    assert reloaded is not first
+    assert reloaded.default_eps == 0.45
+
+
 def test_load_gca_config_with_level_weights(tmp_path: Path) -> None:
     path = _write_config(
         tmp_path,
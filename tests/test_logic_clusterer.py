@@ -1,4 +1,5 @@
 from sanity_log_parser.clustering.logic import LogicClusterer
+from sanity_log_parser.parsing.row import ParsedRow
 
 
 def test_get_logic_signature_replaces_digits_with_wildcards():
@@ -38,3 +39,15 @@ def test_run_sorts_groups_by_count_descending():
     assert len(results) == 2
     assert results[0]["count"] == 2
     assert results[1]["count"] == 1
+
+
+def test_run_groups_parsed_rows_like_equivalent_dicts():
+    clusterer = LogicClusterer()
+    dicts = [
+        {"rule_id": "R1", "variables": ("pipe_1",), "template": "T1", "raw_log": "a"},
+        {"rule_id": "R1", "variables": ("pipe_2",), "template": "T1", "raw_log": "b"},
+        {"rule_id": "R2", "variables": ("NO_VAR",), "template": "T2", "raw_log": "c"},
+    ]
+    rows = [ParsedRow(**log) for log in dicts]
+
+    assert clusterer.run(rows) == clusterer.run(dicts)
@@ -1,6 +1,11 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import pytest
 
 from sanity_log_parser.embeddings.openai_compat import EmbeddingsRequestError
+from sanity_log_parser.embeddings.openai_compat import OpenAICompatibleEmbeddingsClient
 from sanity_log_parser.embeddings.openai_compat import _parse_openai_embeddings_response  # pyright: ignore[reportPrivateUsage]
 
 
@@ -42,3 +47,155 @@ def test_parse_response_raises_for_nonnumeric_values():
 
     with pytest.raises(EmbeddingsRequestError, match="only numeric values"):
         _ = _parse_openai_embeddings_response(payload, expected_size=1)
+
+
+def test_embed_splits_large_inputs_into_ordered_batches(monkeypatch):
+    client = OpenAICompatibleEmbeddingsClient(
+        base_url="http://localhost:8000/v1", model="m", batch_size=2
+    )
+    batches: list[list[str]] = []
+
+    def fake_request(inputs: list[str]) -> list[list[float]]:
+        batches.append(inputs)
+        return [[float(len(text))] for text in inputs]
+
+    monkeypatch.setattr(client, "_embed_request", fake_request)
+
+    vectors = client.embed(["a", "bb", "ccc", "dddd", "eeeee"])
+
+    assert batches == [["a", "bb"], ["ccc", "dddd"], ["eeeee"]]
+    assert vectors == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+
+
+_PROXY_VARS = ("http_proxy", "https_proxy", "no_proxy", "all_proxy")
+
+
+@pytest.fixture
+def no_proxy_env(monkeypatch):
+    for name in _PROXY_VARS:
+        monkeypatch.delenv(name, raising=False)
+        monkeypatch.delenv(name.upper(), raising=False)
+
+
+class _EmbeddingsHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections: set[int] = set()
+    paths: list[str] = []
+
+    def do_POST(self) -> None:  # noqa: N802
+        type(self).connections.add(self.client_address[1])
+        type(self).paths.append(self.path)
+        length = int(self.headers["Content-Length"])
+        inputs = json.loads(self.rfile.read(length))["input"]
+        body = json.dumps(
+            {
+                "data": [
+                    {"index": i, "embedding": [float(len(text))]}
+                    for i, text in enumerate(inputs)
+                ]
+            }
+        ).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+def _serve(handler: type[BaseHTTPRequestHandler]) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def _stop(server: ThreadingHTTPServer) -> None:
+    server.shutdown()
+    server.server_close()
+
+
+def test_embed_reuses_one_connection_across_requests(no_proxy_env):
+    _EmbeddingsHandler.connections = set()
+    server = _serve(_EmbeddingsHandler)
+    client = OpenAICompatibleEmbeddingsClient(
+        base_url=f"http://127.0.0.1:{server.server_port}/v1", model="m", batch_size=1
+    )
+    try:
+        vectors = client.embed(["a", "bb", "ccc"])
+    finally:
+        client.close()
+        _stop(server)
+
+    assert vectors == [[1.0], [2.0], [3.0]]
+    assert len(_EmbeddingsHandler.connections) == 1
+
+
+def test_embed_honours_http_proxy(no_proxy_env, monkeypatch):
+    _EmbeddingsHandler.paths = []
+    proxy = _serve(_EmbeddingsHandler)
+    monkeypatch.setenv("http_proxy", f"http://127.0.0.1:{proxy.server_port}")
+    client = OpenAICompatibleEmbeddingsClient(
+        base_url="http://embeddings.invalid/v1", model="m"
+    )
+    try:
+        vectors = client.embed(["a", "bb"])
+    finally:
+        client.close()
+        _stop(proxy)
+
+    assert vectors == [[1.0], [2.0]]
+    assert _EmbeddingsHandler.paths == ["http://embeddings.invalid/v1/embeddings"]
+
+
+class _RedirectHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:  # noqa: N802
+        _ = self.rfile.read(int(self.headers["Content-Length"]))
+        self.send_response(307)
+        self.send_header("Location", "/v2/embeddings")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+def test_embed_leaves_redirects_to_urllib(no_proxy_env):
+    server = _serve(_RedirectHandler)
+    client = OpenAICompatibleEmbeddingsClient(
+        base_url=f"http://127.0.0.1:{server.server_port}/v1", model="m"
+    )
+    try:
+        with pytest.raises(EmbeddingsRequestError, match="HTTP 307"):
+            _ = client.embed(["a"])
+    finally:
+        client.close()
+        _stop(server)
+
+
+class _HangUpHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:  # noqa: N802
+        _ = self.rfile.read(int(self.headers["Content-Length"]))
+        self.close_connection = True
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+def test_embed_reports_dropped_connection_as_network_error(no_proxy_env):
+    server = _serve(_HangUpHandler)
+    client = OpenAICompatibleEmbeddingsClient(
+        base_url=f"http://127.0.0.1:{server.server_port}/v1", model="m"
+    )
+    try:
+        with pytest.raises(EmbeddingsRequestError, match="Network error"):
+            _ = client.embed(["a"])
+    finally:
+        client.close()
+        _stop(server)
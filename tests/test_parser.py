@@ -33,3 +33,13 @@ def test_parse_line_matching_prefix_with_no_quotes_yields_no_var(parser):
 def test_parse_line_rejects_counter_in_middle_of_prose(parser):
     line = "prefix text 1 of 2 0 Signal 'u_top' not found"
     assert parser.parse_line(line) is None
+
+
+def test_parse_line_row_supports_mapping_access_and_as_dict(parser, sample_matching_line):
+    parsed = parser.parse_line(sample_matching_line)
+
+    assert parsed is not None
+    assert parsed.get("rule_id") == parsed.rule_id == "R001"
+    assert "severity" not in parsed
+    assert parsed.get("severity", "n/a") == "n/a"
+    assert set(parsed.as_dict()) == {"rule_id", "variables", "template", "raw_log"}
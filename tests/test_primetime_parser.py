@@ -454,3 +454,67 @@ def test_non_parent_line_not_misclassified(tmp_path: Path) -> None:
     parser.parse_file(rpt)
     # These lines should NOT update current_rule_id
     assert parser.current_rule_id == "UNKNOWN"
+
+
+def test_parse_file_iter_streams_same_rows_as_parse_file(real_rpt: str) -> None:
+    rows = PrimeTimeParser().parse_file_iter(real_rpt)
+
+    assert not isinstance(rows, list)
+    assert list(rows) == PrimeTimeParser().parse_file(real_rpt)
+
+
+def test_parse_file_with_workers_matches_sequential_parse(tmp_path: Path) -> None:
+    sections = []
+    for i in range(6):
+        severity = "error" if i % 2 == 0 else "warning"
+        sections.append(
+            f" {severity}    2   0\n"
+            f"  CGR_{i:04d}    2   0 Msg 'a'\n"
+            f"       1 of 2     0    First 'sig_{i}' value {i}\n"
+            f"       2 of 2     0    Second 'sig_{i}'\n"
+            "  ----------------\n"
+        )
+    rpt = tmp_path / "multi.rpt"
+    rpt.write_text("".join(sections), encoding="utf-8")
+
+    sequential = PrimeTimeParser().parse_file(str(rpt))
+    parallel = PrimeTimeParser().parse_file(str(rpt), workers=3)
+
+    assert len(sequential) == 12
+    assert parallel == sequential
+
+
+def test_whitespace_only_lines_do_not_reset_rule_context(tmp_path: Path) -> None:
+    content = (
+        " error    2   0\n"
+        "  CGR_0001    2   0 Msg 'a'\n"
+        "   \n"
+        "\t\n"
+        "       1 of 1     0    First 'sig_a'\n"
+    )
+    rpt = tmp_path / "blank.rpt"
+    rpt.write_text(content, encoding="utf-8")
+
+    results = PrimeTimeParser().parse_file(str(rpt))
+
+    assert len(results) == 1
+    assert results[0]["rule_id"] == "CGR_0001"
+
+
+def test_severity_is_case_insensitive_but_rule_ids_are_not(tmp_path: Path) -> None:
+    rpt = _write_rpt(
+        tmp_path,
+        """\
+         ERROR    2   0
+          cgr_0001    2   0 lowercase ids are not parents
+               1 of 1     0    Orphan 'sig_a'
+          CGR_0002    1   0 Msg
+               1 of 1     0    Kept 'sig_b'
+    """,
+    )
+
+    results = PrimeTimeParser().parse_file(rpt)
+
+    assert len(results) == 1
+    assert results[0]["rule_id"] == "CGR_0002"
+    assert results[0]["severity"] == "error"
@@ -2,9 +2,14 @@ import json
 from pathlib import Path
 from typing import cast
 
+import pytest
+
+from sanity_log_parser.results import schema_v2
 from sanity_log_parser.results.schema_v2 import (
     write_results_v2,
+    iter_results_groups,
     read_results,
+    read_results_preview,
     RunMetadata,
     Group,
 )
@@ -192,3 +197,157 @@ def test_sanity_item_absent_in_legacy_mode(tmp_path: Path) -> None:
         payload = json.load(handle)
 
     assert "sanity_item" not in payload["run"]
+
+
+@pytest.fixture(params=[False, True], ids=["loaded", "streamed"])
+def streamed(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> bool:
+    """Run a test on the in-memory path and, when ijson is installed, streamed."""
+    if request.param:
+        pytest.importorskip("ijson")
+        monkeypatch.setattr(schema_v2, "STREAMING_THRESHOLD_BYTES", 0)
+    return request.param
+
+
+def _many_groups(n: int) -> list[Group]:
+    base = _sample_groups()[0]
+    return [
+        cast(Group, {**base, "group_id": f"R001::logic::{i:06d}", "total_count": i})
+        for i in range(1, n + 1)
+    ]
+
+
+def test_read_results_preview_keeps_top_groups_and_totals(
+    tmp_path: Path, streamed: bool
+) -> None:
+    output_path = tmp_path / "subutai_results.json"
+    write_results_v2(path=output_path, run=_sample_run(), groups=_many_groups(6))
+
+    preview = read_results_preview(output_path, top=2)
+
+    assert preview["schema_version"] == 2
+    assert preview["run"] == _sample_run()
+    assert [g["total_count"] for g in preview["groups"]] == [1, 2]
+    assert preview["total_groups"] == 6
+    assert preview["total_logs"] == 21
+
+
+def test_read_results_preview_accepts_legacy_list_root(
+    tmp_path: Path, streamed: bool
+) -> None:
+    output_path = tmp_path / "legacy.json"
+    output_path.write_text(json.dumps(_many_groups(3)), encoding="utf-8")
+
+    preview = read_results_preview(output_path, top=5)
+
+    assert preview["schema_version"] == 1
+    assert preview["run"] is None
+    assert len(preview["groups"]) == 3
+    assert preview["total_logs"] == 6
+
+
+@pytest.mark.parametrize("legacy", [False, True])
+def test_iter_results_groups_yields_every_group(
+    tmp_path: Path, streamed: bool, legacy: bool
+) -> None:
+    output_path = tmp_path / "subutai_results.json"
+    if legacy:
+        output_path.write_text(json.dumps(_many_groups(4)), encoding="utf-8")
+    else:
+        write_results_v2(output_path, _sample_run(), _many_groups(4))
+
+    groups = iter_results_groups(output_path)
+
+    assert not isinstance(groups, list)
+    assert [g["total_count"] for g in groups] == [1, 2, 3, 4]
+
+
+def test_iter_results_groups_rejects_invalid_v2_header(
+    tmp_path: Path, streamed: bool
+) -> None:
+    output_path = tmp_path / "bad.json"
+    output_path.write_text(json.dumps({"schema_version": 3, "groups": []}))
+
+    with pytest.raises(ValueError, match="schema-v2"):
+        list(iter_results_groups(output_path))
+
+
+def test_read_results_coerces_total_count_to_int(tmp_path: Path) -> None:
+    output_path = tmp_path / "legacy.json"
+    output_path.write_text(
+        json.dumps([{"total_count": "7"}, {"total_count": True}, {}]),
+        encoding="utf-8",
+    )
+
+    groups = read_results(output_path)["groups"]
+
+    assert [g["total_count"] for g in groups] == [0, 1, 0]
+
+
+@pytest.mark.parametrize("indent", [2, 4])
+def test_write_results_v2_matches_stdlib_encoding(tmp_path: Path, indent: int) -> None:
+    output_path = tmp_path / "subutai_results.json"
+    groups = _sample_groups()
+    groups[0]["original_logs"] = ["Signal 'ü_top' → not found"]
+
+    write_results_v2(output_path, _sample_run(), groups, indent=indent)
+
+    expected = json.dumps(
+        {"schema_version": 2, "run": _sample_run(), "groups": groups},
+        indent=indent,
+        ensure_ascii=False,
+    )
+    assert output_path.read_bytes() == expected.encode("utf-8")
+
+
+def _write_truncated_results(path: Path) -> None:
+    write_results_v2(path, _sample_run(), _many_groups(4))
+    data = path.read_bytes()
+    _ = path.write_bytes(data[: len(data) - 40])
+
+
+def test_read_results_preview_rejects_truncated_file(
+    tmp_path: Path, streamed: bool
+) -> None:
+    output_path = tmp_path / "truncated.json"
+    _write_truncated_results(output_path)
+
+    with pytest.raises(ValueError):
+        read_results_preview(output_path, top=2)
+
+
+@pytest.mark.parametrize("groups", [None, {}])
+def test_read_results_preview_requires_groups_array(
+    tmp_path: Path,
+    streamed: bool,
+    groups: dict[str, object] | None,
+) -> None:
+    payload: dict[str, object] = {"schema_version": 2, "run": _sample_run()}
+    if groups is not None:
+        payload["groups"] = groups
+    output_path = tmp_path / "no_groups.json"
+    output_path.write_text(json.dumps(payload), encoding="utf-8")
+
+    with pytest.raises(ValueError, match="schema-v2"):
+        read_results_preview(output_path, top=2)
+
+
+def test_iter_results_groups_rejects_truncated_file(
+    tmp_path: Path, streamed: bool
+) -> None:
+    output_path = tmp_path / "truncated.json"
+    _write_truncated_results(output_path)
+
+    with pytest.raises(ValueError):
+        list(iter_results_groups(output_path))
+
+
+def test_iter_results_groups_requires_groups_array(
+    tmp_path: Path, streamed: bool
+) -> None:
+    output_path = tmp_path / "no_groups.json"
+    output_path.write_text(
+        json.dumps({"schema_version": 2, "run": _sample_run()}), encoding="utf-8"
+    )
+
+    with pytest.raises(ValueError, match="schema-v2"):
+        list(iter_results_groups(output_path))
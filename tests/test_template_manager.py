@@ -2,8 +2,6 @@ import hashlib
 
 from sanity_log_parser.parsing.template_manager import RuleTemplateManager
 
-from sanity_log_parser.parsing.template_manager import RuleTemplateManager
-
 
 def test_get_pure_template_replaces_quoted_vars_and_numbers(template_manager):
     text = "Signal 'signal_name' has value 42 and count 7"
@@ -17,6 +15,12 @@ def test_get_pure_template_strips_outer_whitespace(template_manager):
     assert pure == "Path '<VAR>' count <NUM> exceeds <NUM>"
 
 
+def test_get_pure_template_uses_ascii_digits_and_word_boundaries(template_manager):
+    text = "Net 'n1' caf\u00e95 at 12 has \uff13 fanout and x7 y_8"
+    pure = template_manager.get_pure_template(text)
+    assert pure == "Net '<VAR>' caf\u00e9<NUM> at <NUM> has \uff13 fanout and x7 y_8"
+
+
 def test_get_rule_id_returns_loaded_rule_for_known_template(template_manager):
     known_message = (
         "Signal 'top/u_cpu/decode/pipe_4' float Signal "
@@ -29,7 +33,7 @@ def test_get_rule_id_returns_loaded_rule_for_known_template(template_manager):
 def test_get_rule_id_returns_unknown_hash_prefix_for_missing_template(template_manager):
     missing_template = "Completely unseen '<VAR>' with count <NUM>"
     expected = (
-        f"UNKNOWN_{hashlib.md5(missing_template.encode()).hexdigest()[:6].upper()}"
+        f"UNKNOWN_{hashlib.blake2b(missing_template.encode(), digest_size=3).hexdigest().upper()}"
     )
     assert template_manager.get_rule_id(missing_template) == expected
 
@@ -66,7 +70,32 @@ def test_get_rule_id_returns_unknown_for_ambiguous_template_without_exact_match(
     manager = RuleTemplateManager(str(path))
     template = manager.get_pure_template("Signal 'u_any' not found")
     expected = (
-        f"UNKNOWN_{hashlib.md5(template.encode()).hexdigest()[:6].upper()}"
+        f"UNKNOWN_{hashlib.blake2b(template.encode(), digest_size=3).hexdigest().upper()}"
     )
 
     assert manager.get_rule_id(template, raw_log="Signal 'u_any' not found") == expected
+
+
+def test_get_rule_id_reuses_resolved_unknown_id(template_manager):
+    missing_template = "Another unseen '<VAR>' template"
+
+    first = template_manager.get_rule_id(missing_template)
+    second = template_manager.get_rule_id(missing_template)
+
+    assert first == second
+    assert template_manager._resolved == {missing_template: first}
+
+
+def test_template_file_splits_on_unicode_whitespace(tmp_path):
+    path = tmp_path / "rules.log"
+    path.write_text(
+        "R1\u00a01 0 Signal 'u_top' not found\n"
+        "R2\u20031\u30000\tClock 'clk' \u00e9 missing\u00a0\n",
+        encoding="utf-8",
+    )
+    manager = RuleTemplateManager(str(path))
+
+    assert manager.exact_message_dict == {
+        "Signal 'u_top' not found": "R1",
+        "Clock 'clk' \u00e9 missing": "R2",
+    }
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import io
 import json
 from pathlib import Path
 
+from sanity_log_parser.console import Console
 from sanity_log_parser.view import print_report
 
 
@@ -49,3 +51,24 @@ def test_print_report_accepts_single_file_results_without_template(
     assert rc == 0
     assert "Template file" not in output
     assert "Subutai Analysis Report" in output
+
+
+def test_console_write_block_matches_line_by_line_output() -> None:
+    printed = io.StringIO()
+    console = Console(use_color=True, stream=printed)
+    console.section("Title")
+    console.kv("Count", 3)
+    console.info("- log")
+
+    blocked = io.StringIO()
+    block_console = Console(use_color=True, stream=blocked)
+    block_console.write_block(
+        [
+            block_console.format_section("Title"),
+            block_console.format_kv("Count", 3),
+            block_console.format_info("- log"),
+        ]
+    )
+    block_console.write_block([])
+
+    assert blocked.getvalue() == printed.getvalue()